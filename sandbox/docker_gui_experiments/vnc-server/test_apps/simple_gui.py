@@ -10,6 +10,8 @@ import os
 class SimpleGUI:
     def __init__(self):
         self.root = tk.Tk()
+        # Input method polling adds X server round-trips we never need here
+        self.root.tk.call('tk', 'useinputmethods', '0')
         self.root.title("Docker GUI Test - VNC Server")
         self.root.geometry("450x350")
 
@@ -92,6 +94,9 @@ class SimpleGUI:
         )
         instructions.pack(side=tk.BOTTOM, pady=(20, 0))
 
+        # Resolve all pending geometry in one pass instead of per widget
+        self.root.update_idletasks()
+
     def show_message(self):
         messagebox.showinfo(
             "VNC Success!",
@@ -10,6 +10,8 @@ import sys
 class SimpleGUI:
     def __init__(self):
         self.root = tk.Tk()
+        # Input method polling adds X server round-trips we never need here
+        self.root.tk.call('tk', 'useinputmethods', '0')
         self.root.title("Docker GUI Test - X11 Forwarding")
         self.root.geometry("400x300")
 
@@ -69,6 +71,9 @@ class SimpleGUI:
         )
         display_info.pack(side=tk.BOTTOM, pady=(20, 0))
 
+        # Resolve all pending geometry in one pass instead of per widget
+        self.root.update_idletasks()
+
     def show_message(self):
         messagebox.showinfo(
             "Success!",
@@ -5,9 +5,6 @@ from pathlib import Path
 from typing import List, Optional, Dict, Any
 from pymoo.core.problem import Problem
 
-import sys
-sys.path.append(str(Path(__file__).parent.parent.parent / "pymoo_ga_freq_reaper"))
-
 from ga_frequency_demo.genetics import Solution, GenomeToPhenotypeMapper
 from ga_frequency_demo.reaper_integration import ReaperExecutor
 from ga_frequency_demo.config import SessionConfig
@@ -25,7 +22,9 @@ class JSIAudioOptimizationProblem(Problem):
         target_audio_path: Optional[Path] = None,
         session_name_prefix: str = "jsi_audio_ga",
         oracle_noise_level: float = 0.05,
-        show_live_ranking: bool = True
+        show_live_ranking: bool = True,
+        live_update_hz: float = 1.0,
+        runner=None
     ):
         """Initialize JSI audio optimization problem.
 
@@ -36,6 +35,9 @@ class JSIAudioOptimizationProblem(Problem):
             session_name_prefix: Prefix for session names
             oracle_noise_level: Noise level for oracle decisions
             show_live_ranking: Whether to show live JSI ranking updates
+            live_update_hz: Maximum number of live ranking updates per second
+            runner: Optional pymoo runner (e.g. StarmapParallelization) used to
+                analyze each generation's rendered audio in parallel
         """
         # Define problem dimensions (same as original frequency problem)
         n_var = 2  # octave, fine
@@ -49,6 +51,7 @@ class JSIAudioOptimizationProblem(Problem):
         self.reaper_project_path = reaper_project_path
         self.session_name_prefix = session_name_prefix
         self.show_live_ranking = show_live_ranking
+        self.runner = runner
 
         # Initialize REAPER executor
         self.reaper_executor = ReaperExecutor(reaper_project_path)
@@ -71,9 +74,10 @@ class JSIAudioOptimizationProblem(Problem):
         # Note: Don't store Console object directly to avoid serialization issues with pymoo
         self.jsi_evaluator = JSIFitnessEvaluator(
             oracle=self.oracle,
-            console=None  # Will create console when needed
+            console=None,  # Will create console when needed
+            show_live_ranking=show_live_ranking,
+            live_update_hz=live_update_hz
         )
-        self.show_live_ranking = show_live_ranking
 
         # Initialize genome mapper
         self.genome_mapper = GenomeToPhenotypeMapper()
@@ -101,6 +105,13 @@ class JSIAudioOptimizationProblem(Problem):
             # Step 1: Render audio using REAPER
             audio_paths = self._render_population_audio(solutions, session_name)
 
+            # Analyze all renders in parallel before the (sequential) JSI sort,
+            # or at least decode them concurrently when analysis is serial
+            if self.runner is not None:
+                self.oracle.precompute_frequencies(audio_paths.values(), runner=self.runner)
+            else:
+                self.oracle.preload(audio_paths.values())
+
             # Step 2: Use JSI + audio oracle to rank population
             fitness_values = self.jsi_evaluator.evaluate_population_fitness(
                 solutions, audio_paths, self.generation_counter
@@ -286,7 +297,9 @@ class MultiTargetJSIOptimizationProblem(JSIAudioOptimizationProblem):
         target_frequencies: List[float],
         session_name_prefix: str = "multi_jsi_audio_ga",
         oracle_noise_level: float = 0.05,
-        show_live_ranking: bool = True
+        show_live_ranking: bool = True,
+        live_update_hz: float = 1.0,
+        runner=None
     ):
         """Initialize multi-target JSI problem.
 
@@ -296,6 +309,8 @@ class MultiTargetJSIOptimizationProblem(JSIAudioOptimizationProblem):
             session_name_prefix: Session name prefix
             oracle_noise_level: Oracle noise level
             show_live_ranking: Whether to show live ranking
+            live_update_hz: Maximum number of live ranking updates per second
+            runner: Optional pymoo runner for parallel audio analysis
         """
         # Initialize with first target frequency
         super().__init__(
@@ -303,7 +318,9 @@ class MultiTargetJSIOptimizationProblem(JSIAudioOptimizationProblem):
             target_frequency=target_frequencies[0],
             session_name_prefix=session_name_prefix,
             oracle_noise_level=oracle_noise_level,
-            show_live_ranking=show_live_ranking
+            show_live_ranking=show_live_ranking,
+            live_update_hz=live_update_hz,
+            runner=runner
         )
 
         self.target_frequencies = target_frequencies
@@ -1,11 +1,32 @@
 """Entry point for GA + JSI + Audio Oracle integration demo."""
 
+import logging
+import logging.handlers
+import sys
 from pathlib import Path
 from ga_jsi_audio_oracle.main import run_full_demo_suite, demo_jsi_audio_optimization
 
 
+def configure_logging() -> logging.Handler:
+    """Route demo logging to stdout, batching writes to cut flush overhead.
+
+    Returns:
+        The buffering handler, so callers can flush it before printing
+    """
+    stream_handler = logging.StreamHandler(sys.stdout)
+    stream_handler.setFormatter(logging.Formatter("%(message)s"))
+    handler = logging.handlers.MemoryHandler(
+        capacity=100, flushLevel=logging.WARNING, target=stream_handler
+    )
+    root = logging.getLogger()
+    root.setLevel(logging.INFO)
+    root.addHandler(handler)
+    return handler
+
+
 def main():
     """Run the GA + JSI + Audio Oracle demo."""
+    log_handler = configure_logging()
     print("GA + JSI + Audio Oracle Integration Demo")
     print("=" * 50)
 
@@ -28,6 +49,7 @@ def main():
             oracle_noise_level=0.05,
             show_live_ranking=True
         )
+        log_handler.flush()
 
         if result['success']:
             print("\nDemo completed successfully!")
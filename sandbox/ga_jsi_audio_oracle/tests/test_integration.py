@@ -1,12 +1,15 @@
 """Integration tests for the complete GA + JSI + Audio Oracle system."""
 
+import logging
+import logging.handlers
+
 import pytest
 import numpy as np
 from pathlib import Path
 from unittest.mock import Mock, patch, MagicMock
 
 from ga_jsi_audio_oracle.ga_problem import JSIAudioOptimizationProblem
-from ga_jsi_audio_oracle.main import demo_jsi_audio_optimization
+from ga_jsi_audio_oracle.main import demo_jsi_audio_optimization, GenerationLogCallback
 
 
 class TestJSIAudioOptimizationProblem:
@@ -253,3 +256,46 @@ class TestMainDemo:
         assert 'error' in result
         assert result['generations_completed'] == 2
         assert result['total_evaluations'] == 8
+
+
+class TestGenerationLogCallback:
+    """Test suite for GenerationLogCallback."""
+
+    def _algorithm(self, n_gen, fitness):
+        algorithm = Mock()
+        algorithm.n_gen = n_gen
+        algorithm.evaluator.n_eval = n_gen * 4
+        algorithm.pop.get.return_value = np.array(fitness)
+        return algorithm
+
+    def test_records_best_fitness_when_enabled(self):
+        """Test that only (generation, best F) pairs are kept."""
+        callback = GenerationLogCallback(record_history=True)
+
+        callback.notify(self._algorithm(1, [[-0.5], [-0.9]]))
+        callback.notify(self._algorithm(2, [[-0.7], [-1.0]]))
+
+        assert callback.history == [(1, -0.9), (2, -1.0)]
+
+    def test_history_disabled_by_default(self):
+        """Test that nothing is recorded unless requested."""
+        callback = GenerationLogCallback()
+
+        callback.notify(self._algorithm(1, [[-0.5]]))
+
+        assert callback.history == []
+
+    def test_flushes_buffered_log_records(self):
+        """Test that records buffered by a MemoryHandler are released each generation."""
+        target = Mock()
+        handler = logging.handlers.MemoryHandler(capacity=100, target=target)
+        handler.buffer.append(logging.makeLogRecord({'msg': 'live ranking'}))
+        root = logging.getLogger()
+        root.addHandler(handler)
+        try:
+            GenerationLogCallback().notify(self._algorithm(1, [[-0.5]]))
+        finally:
+            root.removeHandler(handler)
+
+        assert handler.buffer == []
+        assert target.handle.call_args.args[0].msg == 'live ranking'
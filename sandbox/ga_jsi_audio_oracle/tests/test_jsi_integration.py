@@ -1,10 +1,16 @@
 """Tests for JSI integration with GA populations."""
 
+import copy
+import gc
+import pickle
+import weakref
+
 import pytest
 import numpy as np
 from pathlib import Path
 from unittest.mock import Mock, patch, MagicMock
 
+from choix_active_online_demo.ranking_tracker import SimpleRankingTracker
 from ga_jsi_audio_oracle.jsi_ga_integration import GAPopulationRanker, JSIFitnessEvaluator
 from ga_jsi_audio_oracle.audio_oracle import AudioComparisonOracle
 
@@ -59,6 +65,18 @@ class TestGAPopulationRanker:
         result = ranker._find_matching_audio_path('sol_001', audio_paths)
         assert result == Path('audio1.wav')
 
+    def test_find_matching_audio_path_index_follows_dict(self):
+        """Test that the fuzzy-match index is rebuilt for a different paths dict."""
+        ranker = GAPopulationRanker(Mock())
+
+        first = {'individual_001_gen_1': Path('gen1_a.wav'), 'individual_002_gen_1': Path('gen1_b.wav')}
+        assert ranker._find_matching_audio_path('sol_002', first) == Path('gen1_b.wav')
+        assert ranker._find_matching_audio_path('sol_001', first) == Path('gen1_a.wav')
+
+        second = {'individual_001_gen_2': Path('gen2_a.wav')}
+        assert ranker._find_matching_audio_path('sol_001', second) == Path('gen2_a.wav')
+        assert ranker._find_matching_audio_path('sol_002', second) is None
+
     def test_find_matching_audio_path_no_match(self):
         """Test finding audio path with no match."""
         oracle = Mock()
@@ -112,7 +130,7 @@ class TestGAPopulationRanker:
         """Test ranking with valid solutions and audio paths."""
         # Mock oracle to always prefer first item
         oracle = Mock()
-        oracle.compare.return_value = True
+        oracle.compare_batch.side_effect = lambda items_a, items_b: [True] * len(items_a)
 
         # Mock tracker
         mock_tracker = Mock()
@@ -150,7 +168,7 @@ class TestGAPopulationRanker:
         """Test adaptive quicksort with audio comparisons."""
         # Mock oracle behavior
         oracle = Mock()
-        oracle.compare.side_effect = [False, True]  # First comparison: pivot wins, second: item wins
+        oracle.compare_batch.return_value = [False, True]  # First comparison: pivot wins, second: item wins
 
         mock_tracker = Mock()
         mock_tracker_class.return_value = mock_tracker
@@ -169,6 +187,201 @@ class TestGAPopulationRanker:
         assert len(result) == 3
         assert all(sol_id in result for sol_id in solution_ids)
         assert ranker.comparison_count == 2  # Two comparisons made
+        # Both comparisons against the pivot went out as a single batch
+        oracle.compare_batch.assert_called_once()
+        items, pivots = oracle.compare_batch.call_args.args
+        assert len(set(pivots)) == 1
+        assert sorted(items + pivots[:1]) == sorted(audio_paths.values())
+        oracle.compare.assert_not_called()
+
+    def test_adaptive_quicksort_audio_sorted_input(self):
+        """Test that an already sorted population does not cost quadratic comparisons."""
+        audio_paths = {f'sol_{i:03d}': Path(f'audio{i}.wav') for i in range(32)}
+        quality = {path: -i for i, path in enumerate(audio_paths.values())}
+        oracle = Mock()
+        oracle.compare_batch.side_effect = lambda items_a, items_b: [
+            quality[a] > quality[b] for a, b in zip(items_a, items_b)
+        ]
+
+        ranker = GAPopulationRanker(oracle, show_live_ranking=False)
+        result = ranker._adaptive_quicksort_audio(list(audio_paths), audio_paths, Mock())
+
+        assert result == list(audio_paths)
+        # A first-item pivot would need all 32 * 31 / 2 = 496 comparisons
+        assert ranker.comparison_count < 250
+
+    def test_adaptive_quicksort_audio_never_asks_implied_pairs(self):
+        """Test that no comparison is implied by earlier answers, even noisy ones."""
+        audio_paths = {f'sol_{i:03d}': Path(f'audio{i}.wav') for i in range(24)}
+        rng = np.random.default_rng(7)
+        beats = {path: set() for path in audio_paths.values()}
+
+        def implied(a, b):
+            # Is a > b reachable through recorded answers?
+            stack, seen = [a], set()
+            while stack:
+                node = stack.pop()
+                if node == b:
+                    return True
+                if node not in seen:
+                    seen.add(node)
+                    stack.extend(beats[node])
+            return False
+
+        def compare_batch(items_a, items_b):
+            results = []
+            for a, b in zip(items_a, items_b):
+                assert not implied(a, b) and not implied(b, a)
+                a_wins = bool(rng.random() < 0.5)
+                beats[a if a_wins else b].add(b if a_wins else a)
+                results.append(a_wins)
+            return results
+
+        oracle = Mock()
+        oracle.compare_batch.side_effect = compare_batch
+        ranker = GAPopulationRanker(oracle, show_live_ranking=False)
+
+        result = ranker._adaptive_quicksort_audio(list(audio_paths), audio_paths, Mock())
+
+        assert sorted(result) == sorted(audio_paths)
+
+    def test_adaptive_quicksort_audio_orders_by_oracle(self):
+        """Test that the iterative quicksort returns the oracle's total order."""
+        audio_paths = {f'sol_{i:03d}': Path(f'audio{i}.wav') for i in range(8)}
+        quality = {path: q for path, q in zip(audio_paths.values(), [3, 7, 1, 6, 0, 5, 2, 4])}
+        oracle = Mock()
+        oracle.compare_batch.side_effect = lambda items_a, items_b: [
+            quality[a] > quality[b] for a, b in zip(items_a, items_b)
+        ]
+
+        ranker = GAPopulationRanker(oracle, show_live_ranking=False)
+        result = ranker._adaptive_quicksort_audio(list(audio_paths), audio_paths, Mock())
+
+        assert result == sorted(audio_paths, key=lambda s: -quality[audio_paths[s]])
+
+    @patch('ga_jsi_audio_oracle.jsi_ga_integration.create_ranking_table')
+    @patch('ga_jsi_audio_oracle.jsi_ga_integration.time.monotonic')
+    def test_show_live_ranking_rate_limited(self, mock_monotonic, mock_create_table):
+        """Test that live ranking tables are emitted at most live_update_hz per second."""
+        mock_create_table.return_value = 'table'
+        tracker = Mock()
+        # The leader changes on every call, so only the rate limit applies
+        tracker.get_simple_ranking.side_effect = [[f"sol_{i:03d}"] for i in range(5)]
+
+        ranker = GAPopulationRanker(Mock(), live_update_hz=2.0)
+
+        for now in [10.0, 10.2, 10.4, 10.6, 11.0]:
+            mock_monotonic.return_value = now
+            ranker._show_live_ranking(tracker)
+
+        # Emits at 10.0 and 10.6; the other calls fall within 0.5s of the last emit
+        assert mock_create_table.call_count == 2
+
+    @patch('ga_jsi_audio_oracle.jsi_ga_integration.create_ranking_table')
+    @patch('ga_jsi_audio_oracle.jsi_ga_integration.time.monotonic')
+    def test_show_live_ranking_skips_unchanged_top(self, mock_monotonic, mock_create_table):
+        """Test that no table is emitted while the leading places stay the same."""
+        mock_create_table.return_value = 'table'
+        tracker = Mock()
+        ranker = GAPopulationRanker(Mock(), live_update_hz=1.0)
+        top = ['sol_000', 'sol_001', 'sol_002', 'sol_003', 'sol_004']
+
+        for now, ranking in [
+            (10.0, top + ['sol_005', 'sol_006']),
+            (12.0, top + ['sol_006', 'sol_005']),  # only the tail moved
+            (14.0, ['sol_001', 'sol_000'] + top[2:]),
+        ]:
+            mock_monotonic.return_value = now
+            tracker.get_simple_ranking.return_value = ranking
+            ranker._show_live_ranking(tracker)
+
+        assert mock_create_table.call_count == 2
+
+    @patch('ga_jsi_audio_oracle.jsi_ga_integration.create_ranking_table')
+    @patch('ga_jsi_audio_oracle.jsi_ga_integration.time.monotonic')
+    def test_show_live_ranking_forced_final_table(self, mock_monotonic, mock_create_table):
+        """Test that a generation's final table bypasses the rate limit."""
+        mock_create_table.return_value = 'table'
+        tracker = Mock()
+        tracker.get_simple_ranking.return_value = ['sol_001', 'sol_000']
+        ranker = GAPopulationRanker(Mock(), live_update_hz=1.0)
+
+        mock_monotonic.return_value = 10.0
+        ranker._show_live_ranking(tracker)
+        mock_monotonic.return_value = 10.1
+        ranker._show_live_ranking(tracker)
+        assert mock_create_table.call_count == 1
+
+        ranker._show_live_ranking(tracker, force=True)
+        assert mock_create_table.call_count == 2
+
+    def test_bt_strengths_from_quicksort_comparisons(self):
+        """Test that a quicksort's comparisons yield a full Bradley-Terry fit."""
+        audio_paths = {f'sol_{i:03d}': Path(f'audio{i}.wav') for i in range(12)}
+        quality = {path: -i for i, path in enumerate(audio_paths.values())}
+        oracle = Mock()
+        oracle.compare_batch.side_effect = lambda items_a, items_b: [
+            quality[a] > quality[b] for a, b in zip(items_a, items_b)
+        ]
+        tracker = SimpleRankingTracker(list(audio_paths))
+
+        ranker = GAPopulationRanker(oracle, show_live_ranking=False)
+        ranker._adaptive_quicksort_audio(list(audio_paths), audio_paths, tracker)
+        ranking, confidence, strengths = tracker.get_bt_ranking_with_confidence()
+
+        # The best item never loses, which an unpenalized fit cannot handle
+        assert confidence > 0
+        assert len(strengths) == 12
+        assert ranking[0] == 'sol_000'
+        assert ranking[-1] == 'sol_011'
+
+    def test_pickle_leaves_oracle_behind(self):
+        """Test that pickling a ranker skips the oracle and reattaches its own one."""
+        oracle = Mock()  # Mocks cannot be pickled
+        ranker = GAPopulationRanker(oracle, show_live_ranking=False, live_update_hz=3.0)
+        ranker.comparison_count = 12
+        ranker.generation_count = 4
+
+        restored = pickle.loads(pickle.dumps(ranker))
+
+        assert restored.oracle is oracle
+        assert restored.comparison_count == 12
+        assert restored.generation_count == 4
+        assert restored.live_update_hz == 3.0
+        assert restored.show_live_ranking is False
+
+    def test_pickle_ignores_newer_oracles(self):
+        """Test that a restored ranker does not pick up another ranker's oracle."""
+        oracle = Mock()
+        ranker = GAPopulationRanker(oracle, show_live_ranking=False)
+        GAPopulationRanker(Mock(), show_live_ranking=False)
+
+        assert copy.deepcopy(ranker).oracle is oracle
+
+    def test_unpickled_without_oracle_raises(self):
+        """Test that a ranker whose oracle is gone fails clearly until one is assigned."""
+        ranker = GAPopulationRanker(Mock(), show_live_ranking=False)
+        data = pickle.dumps(ranker)
+        del ranker
+        gc.collect()
+
+        restored = pickle.loads(data)
+        with pytest.raises(RuntimeError, match="no oracle"):
+            restored.oracle
+
+        oracle = Mock()
+        restored.oracle = oracle
+        assert restored.oracle is oracle
+
+    def test_oracle_not_kept_alive(self):
+        """Test that the module does not keep a finished ranker's oracle alive."""
+        oracle = Mock()
+        ref = weakref.ref(oracle)
+        GAPopulationRanker(oracle, show_live_ranking=False)
+        del oracle
+        gc.collect()
+
+        assert ref() is None
 
 
 class TestJSIFitnessEvaluator:
@@ -264,6 +477,24 @@ class TestJSIFitnessEvaluator:
         assert fitness_values[1] == 0.5  # 1/(1+1)
         assert fitness_values[2] == 1.0/3  # 1/(2+1)
 
+    def test_evaluate_population_fitness_population_order(self):
+        """Test that fitness is returned in population order, not rank order."""
+        mock_ranker = Mock()
+        solutions = [MockSolution(0.5, 0.2), MockSolution(-0.3, 0.8), MockSolution(0.1, -0.5)]
+        # Best to worst: solutions[2], solutions[0], solutions[1]
+        mock_ranker.rank_population_with_audio.return_value = (
+            [solutions[2], solutions[0], solutions[1]],
+            [1.0, 0.6, 0.3],
+            {'comparisons_made': 3, 'ranked_indices': [2, 0, 1]}
+        )
+
+        evaluator = JSIFitnessEvaluator(Mock(), fitness_normalization="inverse")
+        evaluator.ranker = mock_ranker
+
+        fitness_values = evaluator.evaluate_population_fitness(solutions, {}, generation=1)
+
+        assert fitness_values == [0.5, 1.0 / 3, 1.0]
+
     def test_get_ranking_info(self):
         """Test getting ranking information."""
         oracle = Mock()
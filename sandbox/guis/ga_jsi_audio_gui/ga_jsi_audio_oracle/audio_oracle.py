@@ -1,25 +1,156 @@
 """Audio comparison oracle using librosa for frequency-based comparisons."""
 
-import librosa
+import hashlib
 import numpy as np
+import os
+import soundfile as sf
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
+from numba import njit
 from pathlib import Path
-from typing import Any, Optional, Tuple
+from scipy.signal import resample_poly
+from typing import Any, Callable, Iterable, Optional, Sequence, Tuple
 import warnings
 
-import sys
-sys.path.append(str(Path(__file__).parent.parent.parent / "choix_active_online"))
 from choix_active_online_demo.comparison_oracle import ComparisonOracle
 
+# Part of every on-disk f0 cache key; bump it whenever the estimator's
+# results change so entries written by an older version are not reused
+_F0_ESTIMATOR_VERSION = "yin-1"
+
+
+@njit(cache=True, fastmath=True)
+def _pitch_reduce(pitches, magnitudes, scratch):
+    """Median of the per-frame magnitude-weighted pitch from piptrack output.
+
+    Args:
+        pitches: (bins, frames) pitch matrix from librosa.piptrack
+        magnitudes: (bins, frames) magnitude matrix from librosa.piptrack
+        scratch: (3, >= frames) float64 work buffer, overwritten in place
+
+    Returns:
+        Median pitch in Hz, or -1.0 if no frame has a weighted pitch
+    """
+    n_bins, n_frames = pitches.shape
+    weighted = scratch[0, :n_frames]
+    total = scratch[1, :n_frames]
+    weighted[:] = 0.0
+    total[:] = 0.0
+
+    # Row-major walk to match the (bins, frames) memory layout
+    for i in range(n_bins):
+        for t in range(n_frames):
+            if pitches[i, t] > 0:
+                weighted[t] += pitches[i, t] * magnitudes[i, t]
+                total[t] += magnitudes[i, t]
+
+    f0_values = scratch[2, :n_frames]
+    count = 0
+    for t in range(n_frames):
+        if total[t] > 0:
+            f0_values[count] = weighted[t] / total[t]
+            count += 1
+
+    if count == 0:
+        return -1.0
+    return np.median(f0_values[:count])
+
+
+# Compile (or load from cache) now rather than inside the first GA generation
+_pitch_reduce(
+    np.ones((2, 2), dtype=np.float32),
+    np.ones((2, 2), dtype=np.float32),
+    np.empty((3, 2)),
+)
+
+
+@njit(cache=True, fastmath=True)
+def _yin_f0(audio, sr, fmin=50.0, fmax=2000.0, threshold=0.1):
+    """Estimate the fundamental frequency of a segment with the YIN method.
+
+    Runs on one analysis window taken from the middle of the audio, past the
+    attack of a rendered note.
+
+    Args:
+        audio: 1-D audio time series
+        sr: Sample rate of the audio
+        fmin: Lowest detectable frequency in Hz
+        fmax: Highest detectable frequency in Hz
+        threshold: Cumulative mean normalized difference below which a lag
+            counts as periodic
+
+    Returns:
+        Fundamental frequency in Hz, or -1.0 if the audio is too short or
+        has no periodic component
+    """
+    tau_min = max(2, int(sr / fmax))
+    tau_max = int(sr / fmin)
+    window = tau_max
+    if audio.shape[0] < window + tau_max + 2:
+        return -1.0
+    start = (audio.shape[0] - window - tau_max - 1) // 2
+
+    # Difference function d(tau) over the window
+    diff = np.zeros(tau_max + 2)
+    for tau in range(1, tau_max + 2):
+        acc = 0.0
+        for j in range(start, start + window):
+            delta = audio[j] - audio[j + tau]
+            acc += delta * delta
+        diff[tau] = acc
+
+    # Cumulative mean normalized difference d'(tau)
+    cmnd = np.ones(tau_max + 2)
+    running = 0.0
+    for tau in range(1, tau_max + 2):
+        running += diff[tau]
+        if running > 0:
+            cmnd[tau] = diff[tau] * tau / running
+
+    # First dip below the threshold, followed down to its local minimum
+    best = -1
+    for tau in range(tau_min, tau_max + 1):
+        if cmnd[tau] < threshold:
+            while tau < tau_max and cmnd[tau + 1] < cmnd[tau]:
+                tau += 1
+            best = tau
+            break
+    if best < 0:
+        return -1.0
+
+    # Parabolic interpolation around the minimum
+    a = cmnd[best - 1]
+    b = cmnd[best]
+    c = cmnd[best + 1]
+    denom = a - 2.0 * b + c
+    shift = 0.5 * (a - c) / denom if denom != 0 else 0.0
+    return sr / (best + shift)
+
+
+# Compile (or load from cache) the float32 specialization used for decoded audio
+_yin_f0(np.zeros(256, dtype=np.float32), 8000)
+
 
 class AudioComparisonOracle(ComparisonOracle):
     """Oracle that compares audio files based on their proximity to a target frequency."""
 
+    # Maximum number of files whose analysis results are kept
+    F0_CACHE_SIZE = 4096
+    # Maximum number of decoded waveforms kept (each is ~350 KB for 2 s at 44.1 kHz)
+    AUDIO_CACHE_SIZE = 256
+    # Uniform draws generated at a time for single comparisons
+    NOISE_BUFFER_SIZE = 4096
+
     def __init__(
         self,
         target_frequency: float = 440.0,
         sr: int = 44100,
         noise_level: float = 0.05,
         random_seed: int = 42,
+        keep_audio: bool = False,
+        max_duration: Optional[float] = 2.0,
+        cache_dir: Optional[Path] = None,
     ):
         """Initialize audio comparison oracle.
 
@@ -28,14 +159,40 @@ class AudioComparisonOracle(ComparisonOracle):
             sr: Sample rate for audio processing
             noise_level: Amount of noise to add to decisions (0.0 = perfect, 1.0 = random)
             random_seed: Random seed for reproducibility
+            keep_audio: Whether to keep decoded waveforms after their
+                fundamental frequency is known
+            max_duration: Seconds of each file to decode for analysis
+                (None = whole file)
+            cache_dir: Directory for a persistent f0 cache shared across
+                runs, keyed by file content (None = in-memory only)
         """
         self.target_frequency = target_frequency
         self.sr = sr
         self.noise_level = noise_level
-        self.rng = np.random.RandomState(random_seed)
-
-        # Cache for loaded audio to avoid repeated I/O
-        self._audio_cache = {}
+        self._noise_buf = np.empty(0)
+        self._noise_idx = 0
+        self.rng = np.random.Generator(np.random.SFC64(random_seed))
+        self.keep_audio = keep_audio
+        self.max_duration = max_duration
+        self.cache_dir = Path(cache_dir) if cache_dir is not None else None
+        if self.cache_dir is not None:
+            self.cache_dir.mkdir(parents=True, exist_ok=True)
+
+        # Per-file caches are keyed by (path, mtime_ns) so that a render
+        # overwritten in place is analyzed again, and evict the least
+        # recently used file once full.
+        # Decoded audio, up to AUDIO_CACHE_SIZE files. Only the f0 is needed
+        # for comparisons, so by default a waveform leaves once it is analyzed
+        self._audio_cache = OrderedDict()
+        # Fundamental frequencies (independent of the target), up to F0_CACHE_SIZE
+        self._f0_cache = OrderedDict()
+        # Distance to the current target (reset when the target moves), up to F0_CACHE_SIZE
+        self._dist_cache = OrderedDict()
+        # Whole-file content digests naming on-disk f0 entries, up to
+        # F0_CACHE_SIZE, so a file is hashed once however often it is looked up
+        self._digest_cache = OrderedDict()
+        # Work buffer for _pitch_reduce, grown when a file has more frames
+        self._scratch = np.empty((3, 8192))
 
     def compare(self, item_a: Any, item_b: Any) -> bool:
         """Compare two audio items based on proximity to target frequency.
@@ -47,13 +204,21 @@ class AudioComparisonOracle(ComparisonOracle):
         Returns:
             True if item_a is closer to target frequency than item_b
         """
-        # Extract fundamental frequencies
-        freq_a = self._get_fundamental_frequency(item_a)
-        freq_b = self._get_fundamental_frequency(item_b)
-
-        # Calculate distances from target
-        dist_a = abs(freq_a - self.target_frequency)
-        dist_b = abs(freq_b - self.target_frequency)
+        # A file compared with itself is a coin flip; skip the analysis
+        if (
+            isinstance(item_a, (str, Path))
+            and isinstance(item_b, (str, Path))
+            and Path(item_a) == Path(item_b)
+        ):
+            return self._next_uniform() < 0.5
+
+        # Distances of the fundamental frequencies from target
+        dist_a = self._get_distance(item_a)
+        dist_b = self._get_distance(item_b)
+
+        # Equally close, so noise cannot tip the balance either way
+        if dist_a == dist_b:
+            return self._next_uniform() < 0.5
 
         # Determine which is closer (lower distance is better)
         prob_a_wins = self._calculate_win_probability(dist_a, dist_b)
@@ -61,34 +226,319 @@ class AudioComparisonOracle(ComparisonOracle):
         # Add noise
         noisy_prob = (1 - self.noise_level) * prob_a_wins + self.noise_level * 0.5
 
-        return self.rng.random() < noisy_prob
+        return self._next_uniform() < noisy_prob
+
+    @property
+    def rng(self) -> np.random.Generator:
+        """Random generator for decision noise."""
+        return self._rng
+
+    @rng.setter
+    def rng(self, generator: np.random.Generator) -> None:
+        self._rng = generator
+        # Draws buffered from the previous generator must not be reused
+        self._noise_idx = len(self._noise_buf)
+
+    def _next_uniform(self) -> float:
+        """Next uniform [0, 1) draw, taken from a block-generated buffer.
+
+        Returns:
+            Uniform random number
+        """
+        if self._noise_idx == len(self._noise_buf):
+            self._noise_buf = self._rng.random(self.NOISE_BUFFER_SIZE)
+            self._noise_idx = 0
+        u = float(self._noise_buf[self._noise_idx])
+        self._noise_idx += 1
+        return u
+
+    def compare_batch(self, items_a: Sequence[Any], items_b: Sequence[Any]) -> np.ndarray:
+        """Compare many pairs of audio items in one call.
+
+        Each distinct item is analyzed once, and win probabilities and noise
+        draws are computed for all pairs together.
+
+        Args:
+            items_a: First item of each pair (paths or frequencies)
+            items_b: Second item of each pair (paths or frequencies)
+
+        Returns:
+            Boolean array, True where item_a is closer to target than item_b
+        """
+        n = len(items_a)
+        if n != len(items_b):
+            raise ValueError("items_a and items_b must have the same length")
+        if n == 0:
+            return np.zeros(0, dtype=bool)
+
+        unique, inverse = np.unique(
+            np.concatenate([np.asarray(items_a), np.asarray(items_b)]),
+            return_inverse=True
+        )
+        dists = np.array([self._get_distance(item) for item in unique])
+
+        dist_a = dists[inverse[:n]]
+        dist_b = dists[inverse[n:]]
+
+        prob_a_wins = self._calculate_win_probability(dist_a, dist_b)
+        noisy_prob = (1 - self.noise_level) * prob_a_wins + self.noise_level * 0.5
+
+        return self.rng.random(n) < noisy_prob
+
+    def _get_distance(self, item: Any) -> float:
+        """Get the distance of an item's fundamental frequency from the target.
+
+        Args:
+            item: Audio file path, audio data, or a known frequency in Hz
+
+        Returns:
+            Absolute distance from the target frequency in Hz
+        """
+        if isinstance(item, (str, Path)):
+            audio_path = Path(item)
+            key = _file_key(audio_path)
+            if key in self._dist_cache:
+                self._dist_cache.move_to_end(key)
+                return self._dist_cache[key]
+
+            dist = abs(self._get_fundamental_frequency(audio_path) - self.target_frequency)
+            self._lru_store(self._dist_cache, key, dist)
+            return dist
+
+        return abs(self._get_fundamental_frequency(item) - self.target_frequency)
 
     def _get_fundamental_frequency(self, item: Any) -> float:
         """Extract fundamental frequency from audio item.
 
         Args:
-            item: Audio file path or audio data
+            item: Audio file path, audio data, or a known frequency in Hz
 
         Returns:
             Estimated fundamental frequency in Hz
         """
+        if isinstance(item, (int, float, np.number)):
+            # Already a frequency (used for synthetic comparisons)
+            return float(item)
+
         if isinstance(item, (str, Path)):
             audio_path = Path(item)
+            key = _file_key(audio_path)
+
+            if key in self._f0_cache:
+                self._f0_cache.move_to_end(key)
+                return self._f0_cache[key]
 
-            # Use cache to avoid repeated loading
-            if audio_path in self._audio_cache:
-                audio = self._audio_cache[audio_path]
+            # Decoded audio (e.g. from preload) is cheaper than hashing the
+            # whole file for the disk cache
+            if key in self._audio_cache:
+                audio = self._audio_cache[key] if self.keep_audio else self._audio_cache.pop(key)
             else:
+                f0 = self._disk_f0_lookup(audio_path, key)
+                if f0 is not None:
+                    self._lru_store(self._f0_cache, key, f0)
+                    return f0
                 audio = self._load_audio(audio_path)
-                self._audio_cache[audio_path] = audio
+            if self.keep_audio:
+                self._lru_store(self._audio_cache, key, audio, self.AUDIO_CACHE_SIZE)
+
+            f0 = self._estimate_fundamental_frequency(audio)
+            self._lru_store(self._f0_cache, key, f0)
+            self._disk_f0_store(audio_path, key, f0)
+            return f0
+
+        # Assume it's already audio data
+        return self._estimate_fundamental_frequency(item)
+
+    def _lru_store(
+        self,
+        cache: OrderedDict,
+        key: Any,
+        value: Any,
+        maxsize: Optional[int] = None,
+    ) -> None:
+        """Insert into a per-file cache, evicting least recently used entries.
+
+        Args:
+            cache: One of the oracle's OrderedDict caches
+            key: Cache key
+            value: Value to store
+            maxsize: Maximum number of entries (defaults to F0_CACHE_SIZE)
+        """
+        cache[key] = value
+        cache.move_to_end(key)
+        if maxsize is None:
+            maxsize = self.F0_CACHE_SIZE
+        while len(cache) > maxsize:
+            cache.popitem(last=False)
+
+    def precompute_frequencies(
+        self,
+        audio_paths: Iterable[Path],
+        runner: Optional[Callable] = None,
+    ) -> None:
+        """Estimate fundamental frequencies for a batch of audio files up front.
+
+        Args:
+            audio_paths: Audio files that will be compared
+            runner: Optional pymoo-style runner called as runner(f, items),
+                e.g. StarmapParallelization, to analyze files in parallel
+        """
+        pending = []
+        keys = []
+        for path in map(Path, audio_paths):
+            key = _file_key(path)
+            # _file_key has already stat'ed the file; mtime -1 means missing
+            if key in self._f0_cache or key[1] < 0:
+                continue
+            f0 = self._disk_f0_lookup(path, key)
+            if f0 is not None:
+                self._lru_store(self._f0_cache, key, f0)
+            else:
+                pending.append(path)
+                keys.append(key)
+        if not pending:
+            return
+
+        analyze = partial(
+            _analyze_audio_file, sr=self.sr, max_duration=self.max_duration
+        )
+        if runner is not None:
+            frequencies = runner(analyze, pending)
         else:
-            # Assume it's already audio data
-            audio = item
+            frequencies = [analyze(path) for path in pending]
 
-        return self._estimate_fundamental_frequency(audio)
+        for path, key, frequency in zip(pending, keys, frequencies):
+            if frequency is not None:
+                self._lru_store(self._f0_cache, key, frequency)
+                self._disk_f0_store(path, key, frequency)
+
+    def _file_digest(self, audio_path: Path, key: Tuple[str, int]) -> Optional[str]:
+        """Digest of a file's whole content, computed once per file version.
+
+        Args:
+            audio_path: Path to audio file
+            key: The file's _file_key
+
+        Returns:
+            Hex digest, or None if the file cannot be read
+        """
+        if key in self._digest_cache:
+            self._digest_cache.move_to_end(key)
+            return self._digest_cache[key]
+        try:
+            h = hashlib.blake2b(digest_size=16)
+            with open(audio_path, 'rb') as f:
+                for block in iter(lambda: f.read(1 << 20), b''):
+                    h.update(block)
+        except OSError:
+            return None
+        digest = h.hexdigest()
+        self._lru_store(self._digest_cache, key, digest)
+        return digest
+
+    def _disk_f0_path(self, audio_path: Path, key: Tuple[str, int]) -> Optional[Path]:
+        """Location of a file's entry in the on-disk f0 cache.
+
+        Entries are named by a hash of the whole file, the estimator version
+        and the analysis settings, so a re-rendered file or a changed
+        estimator gets a fresh entry while an identical render in another
+        run reuses the old one.
+
+        Args:
+            audio_path: Path to audio file
+            key: The file's _file_key
+
+        Returns:
+            Cache entry path, or None without a cache_dir or readable file
+        """
+        if self.cache_dir is None:
+            return None
+        digest = self._file_digest(audio_path, key)
+        if digest is None:
+            return None
+        h = hashlib.blake2b(digest.encode(), digest_size=16)
+        h.update(f"{_F0_ESTIMATOR_VERSION}:{self.sr}:{self.max_duration}".encode())
+        return self.cache_dir / f"{h.hexdigest()}.f0"
+
+    def _disk_f0_lookup(self, audio_path: Path, key: Tuple[str, int]) -> Optional[float]:
+        """Read a file's fundamental frequency from the on-disk cache.
+
+        Args:
+            audio_path: Path to audio file
+            key: The file's _file_key
+
+        Returns:
+            Cached frequency in Hz, or None on a miss
+        """
+        entry = self._disk_f0_path(audio_path, key)
+        if entry is None:
+            return None
+        try:
+            data = entry.read_bytes()
+        except OSError:
+            return None
+        if len(data) != 8:
+            return None
+        return float(np.frombuffer(data, dtype='<f8')[0])
+
+    def _disk_f0_store(self, audio_path: Path, key: Tuple[str, int], f0: float) -> None:
+        """Persist a file's fundamental frequency as 8 bytes in the cache.
+
+        Args:
+            audio_path: Path to audio file
+            key: The file's _file_key
+            f0: Estimated fundamental frequency in Hz
+        """
+        entry = self._disk_f0_path(audio_path, key)
+        if entry is None:
+            return
+        # Write then rename, so a concurrent reader never sees half an entry
+        tmp = entry.with_name(f"{entry.name}.{os.getpid()}.tmp")
+        try:
+            tmp.write_bytes(np.float64(f0).astype('<f8').tobytes())
+            os.replace(tmp, entry)
+        except OSError as e:
+            warnings.warn(f"Could not write f0 cache entry {entry}: {e}")
+
+    def preload(self, audio_paths: Iterable[Path]) -> None:
+        """Decode a batch of audio files concurrently into the audio cache.
+
+        Decoding and resampling release the GIL, so threads overlap them.
+        Files whose f0 is already known, in memory or on disk, are skipped;
+        files that fail to load are left for compare() to report.
+
+        Args:
+            audio_paths: Audio files that will be compared
+        """
+        pending = {}
+        for path in map(Path, audio_paths):
+            key = _file_key(path)
+            if key in self._f0_cache or key in self._audio_cache or key[1] < 0:
+                continue
+            f0 = self._disk_f0_lookup(path, key)
+            if f0 is not None:
+                self._lru_store(self._f0_cache, key, f0)
+            else:
+                pending[key] = path
+        if not pending:
+            return
+
+        def load(path):
+            try:
+                return self._load_audio(path)
+            except Exception as e:
+                warnings.warn(f"Could not preload {path}: {e}")
+                return None
+
+        with ThreadPoolExecutor(max_workers=min(len(pending), os.cpu_count() or 1)) as executor:
+            decoded = list(executor.map(load, pending.values()))
+
+        for key, audio in zip(pending, decoded):
+            if audio is not None:
+                self._lru_store(self._audio_cache, key, audio, self.AUDIO_CACHE_SIZE)
 
     def _load_audio(self, audio_path: Path) -> np.ndarray:
-        """Load audio file using librosa.
+        """Load audio file as mono float32 at the oracle's sample rate.
 
         Args:
             audio_path: Path to audio file
@@ -99,11 +549,10 @@ class AudioComparisonOracle(ComparisonOracle):
         if not audio_path.exists():
             raise FileNotFoundError(f"Audio file not found: {audio_path}")
 
-        audio, _ = librosa.load(str(audio_path), sr=self.sr, mono=True)
-        return audio
+        return _read_audio(audio_path, self.sr, self.max_duration)
 
     def _estimate_fundamental_frequency(self, audio: np.ndarray) -> float:
-        """Estimate fundamental frequency using librosa.
+        """Estimate fundamental frequency with YIN, falling back to librosa.
 
         Args:
             audio: Audio time series
@@ -114,35 +563,45 @@ class AudioComparisonOracle(ComparisonOracle):
         if len(audio) == 0:
             return 0.0
 
-        # Use piptrack for pitch estimation
-        pitches, magnitudes = librosa.piptrack(y=audio, sr=self.sr, threshold=0.1)
-
-        # Extract pitch values weighted by magnitude
-        f0_values = []
-        for t in range(pitches.shape[1]):
-            # Get indices of non-zero pitches
-            pitch_indices = np.where(pitches[:, t] > 0)[0]
-            if len(pitch_indices) > 0:
-                # Weight by magnitude and take strongest
-                mag_weights = magnitudes[pitch_indices, t]
-                if np.sum(mag_weights) > 0:
-                    weighted_pitch = np.average(
-                        pitches[pitch_indices, t], weights=mag_weights
-                    )
-                    f0_values.append(weighted_pitch)
-
-        if not f0_values:
+        # Decoded audio is already float32; raw arrays passed in are brought
+        # down to it so the STFT runs in complex64 and YIN reuses its
+        # compiled float32 specialization
+        audio = np.asarray(audio, dtype=np.float32)
+
+        # Time-domain YIN on a single window (JIT-compiled)
+        f0 = _yin_f0(audio, self.sr)
+        if f0 > 0:
+            return f0
+
+        # Too short or aperiodic for YIN: use piptrack for pitch estimation.
+        # librosa is slow to import and only needed here, so load it lazily
+        import librosa
+
+        # One magnitude STFT serves both piptrack and the centroid fallback
+        S = np.abs(librosa.stft(audio))
+        pitches, magnitudes = librosa.piptrack(S=S, sr=self.sr, threshold=0.1)
+
+        # Median over frames of the magnitude-weighted pitch (JIT-compiled)
+        n_frames = pitches.shape[1]
+        if self._scratch.shape[1] < n_frames:
+            self._scratch = np.empty((3, n_frames))
+        f0 = _pitch_reduce(pitches, magnitudes, self._scratch)
+
+        if f0 < 0:
             # Fallback: use spectral centroid as frequency proxy
-            spectral_centroid = librosa.feature.spectral_centroid(y=audio, sr=self.sr)[
+            spectral_centroid = librosa.feature.spectral_centroid(S=S, sr=self.sr)[
                 0
             ]
-            return np.mean(spectral_centroid) if len(spectral_centroid) > 0 else 440.0
+            return float(np.mean(spectral_centroid)) if len(spectral_centroid) > 0 else 440.0
 
-        return np.median(f0_values)  # Use median for robustness
+        return f0
 
-    def _calculate_win_probability(self, dist_a: float, dist_b: float) -> float:
+    def _calculate_win_probability(self, dist_a, dist_b):
         """Calculate probability that item A wins based on distances from target.
 
+        Works element-wise on NumPy arrays as well as on scalars. Equal
+        distances give equal strengths and therefore exactly 0.5.
+
         Args:
             dist_a: Distance of item A from target frequency
             dist_b: Distance of item B from target frequency
@@ -150,17 +609,11 @@ class AudioComparisonOracle(ComparisonOracle):
         Returns:
             Probability that item A wins (is closer to target)
         """
-        if dist_a == dist_b:
-            return 0.5
-
-        # Use exponential decay: closer distances have higher strength
-        # Add small epsilon to avoid division by zero
+        # Bradley-Terry with strength 1 / (distance + epsilon), so closer items
+        # are stronger; epsilon avoids division by zero. sa / (sa + sb)
+        # simplifies to a single division
         epsilon = 1e-6
-        strength_a = 1.0 / (dist_a + epsilon)
-        strength_b = 1.0 / (dist_b + epsilon)
-
-        # Bradley-Terry probability
-        return strength_a / (strength_a + strength_b)
+        return (dist_b + epsilon) / (dist_a + dist_b + 2 * epsilon)
 
     def set_target_frequency(self, frequency: float) -> None:
         """Update the target frequency for comparisons.
@@ -169,12 +622,24 @@ class AudioComparisonOracle(ComparisonOracle):
             frequency: New target frequency in Hz
         """
         self.target_frequency = frequency
-        # Clear cache since target changed
-        self._audio_cache.clear()
+        # Only distances depend on the target; decoded audio and f0s stay valid
+        self._dist_cache.clear()
+
+    def set_noise_level(self, level: float) -> None:
+        """Update the amount of noise added to decisions.
+
+        Args:
+            level: New noise level (0.0 = perfect, 1.0 = random)
+        """
+        # Noise only enters at decision time, so every cache stays valid
+        self.noise_level = level
 
     def clear_cache(self) -> None:
         """Clear the audio cache to free memory."""
         self._audio_cache.clear()
+        self._f0_cache.clear()
+        self._dist_cache.clear()
+        self._digest_cache.clear()
 
     def get_cache_info(self) -> dict:
         """Get information about the current audio cache.
@@ -185,9 +650,91 @@ class AudioComparisonOracle(ComparisonOracle):
         return {
             "cached_files": len(self._audio_cache),
             "cache_keys": list(self._audio_cache.keys()),
+            "cached_frequencies": len(self._f0_cache),
         }
 
 
+def _read_audio(audio_path: Path, sr: int, max_duration: Optional[float] = None) -> np.ndarray:
+    """Read an audio file as mono float32, resampling only if needed.
+
+    soundfile decodes straight to float32, so files already at sr (the usual
+    case for REAPER renders) skip resampling entirely; others go through a
+    polyphase filter rather than librosa's resampler.
+    A pitch estimate needs only a stretch of steady tone, so decoding can
+    stop after max_duration seconds.
+
+    Args:
+        audio_path: Path to audio file
+        sr: Target sample rate
+        max_duration: Seconds to read from the start of the file (None = all)
+
+    Returns:
+        Audio time series
+    """
+    with sf.SoundFile(str(audio_path)) as f:
+        file_sr = f.samplerate
+        frames = -1 if max_duration is None else int(max_duration * file_sr)
+        audio = f.read(frames=frames, dtype='float32', always_2d=False)
+    if audio.ndim == 2:
+        audio = audio.mean(axis=1)
+    if file_sr != sr:
+        audio = resample_poly(audio, sr, file_sr).astype(np.float32, copy=False)
+    return audio
+
+
+def _file_key(audio_path: Path) -> Tuple[str, int]:
+    """Cache key for an audio file: its path and modification time.
+
+    Args:
+        audio_path: Path to audio file
+
+    Returns:
+        (path, mtime in ns), with mtime -1 for files that cannot be stat'ed
+    """
+    try:
+        mtime = audio_path.stat().st_mtime_ns
+    except OSError:
+        mtime = -1
+    return (str(audio_path), mtime)
+
+
+# Analysis oracles owned by this process, one per (sample rate, max_duration)
+_worker_oracles = {}
+
+
+def _analyze_audio_file(
+    audio_path: Path,
+    sr: int,
+    max_duration: Optional[float] = 2.0,
+) -> Optional[float]:
+    """Load an audio file and estimate its fundamental frequency.
+
+    Module-level so it can be shipped to worker processes. Only the path and
+    analysis settings cross the process boundary and only a scalar comes
+    back; the oracle doing the work is built once per worker and reused, so
+    its pitch buffers survive from one file (and generation) to the next.
+
+    Args:
+        audio_path: Path to audio file
+        sr: Sample rate for audio processing
+        max_duration: Seconds of the file to decode (None = whole file)
+
+    Returns:
+        Estimated fundamental frequency in Hz, or None if analysis failed
+    """
+    settings = (sr, max_duration)
+    oracle = _worker_oracles.get(settings)
+    if oracle is None:
+        oracle = _worker_oracles[settings] = AudioComparisonOracle(
+            sr=sr, max_duration=max_duration
+        )
+    try:
+        return oracle._estimate_fundamental_frequency(oracle._load_audio(audio_path))
+    except Exception as e:
+        warnings.warn(f"Could not analyze {audio_path}: {e}")
+        return None
+
+
 class FrequencyTargetOracle(AudioComparisonOracle):
     """Specialized oracle that compares audio files against a target audio file."""
 
@@ -206,16 +753,16 @@ class FrequencyTargetOracle(AudioComparisonOracle):
             noise_level: Amount of noise to add to decisions
             random_seed: Random seed for reproducibility
         """
-        # Extract target frequency from audio file
-        target_freq = self._extract_target_frequency(target_audio_path, sr)
-
         super().__init__(
-            target_frequency=target_freq,
             sr=sr,
             noise_level=noise_level,
             random_seed=random_seed,
         )
 
+        # Extract target frequency from audio file (needs the initialized
+        # sample rate and pitch buffers)
+        self.target_frequency = self._extract_target_frequency(target_audio_path, sr)
+
         self.target_audio_path = target_audio_path
 
     def _extract_target_frequency(self, audio_path: Path, sr: int) -> float:
@@ -233,7 +780,7 @@ class FrequencyTargetOracle(AudioComparisonOracle):
             return 440.0
 
         try:
-            audio, _ = librosa.load(str(audio_path), sr=sr, mono=True)
+            audio = _read_audio(audio_path, sr, self.max_duration)
             return self._estimate_fundamental_frequency(audio)
         except Exception as e:
             warnings.warn(f"Error loading target audio: {e}, using 440 Hz")
@@ -1,13 +1,11 @@
 """GA problem class that integrates JSI ranking with audio oracle comparisons."""
 
+import hashlib
 import numpy as np
 from pathlib import Path
 from typing import List, Optional, Dict, Any
 from pymoo.core.problem import Problem
 
-import sys
-sys.path.append(str(Path(__file__).parent.parent.parent / "pymoo_ga_freq_reaper"))
-
 from ga_frequency_demo.genetics import Solution, GenomeToPhenotypeMapper
 from ga_frequency_demo.reaper_integration import ReaperExecutor
 from ga_frequency_demo.config import SessionConfig
@@ -25,7 +23,9 @@ class JSIAudioOptimizationProblem(Problem):
         target_audio_path: Optional[Path] = None,
         session_name_prefix: str = "jsi_audio_ga",
         oracle_noise_level: float = 0.05,
-        show_live_ranking: bool = True
+        show_live_ranking: bool = True,
+        live_update_hz: float = 1.0,
+        runner=None
     ):
         """Initialize JSI audio optimization problem.
 
@@ -36,6 +36,9 @@ class JSIAudioOptimizationProblem(Problem):
             session_name_prefix: Prefix for session names
             oracle_noise_level: Noise level for oracle decisions
             show_live_ranking: Whether to show live JSI ranking updates
+            live_update_hz: Maximum number of live ranking updates per second
+            runner: Optional pymoo runner (e.g. StarmapParallelization) used to
+                analyze each generation's rendered audio in parallel
         """
         # Define problem dimensions (same as original frequency problem)
         n_var = 2  # octave, fine
@@ -49,6 +52,7 @@ class JSIAudioOptimizationProblem(Problem):
         self.reaper_project_path = reaper_project_path
         self.session_name_prefix = session_name_prefix
         self.show_live_ranking = show_live_ranking
+        self.runner = runner
 
         # Initialize REAPER executor
         self.reaper_executor = ReaperExecutor(reaper_project_path)
@@ -71,9 +75,10 @@ class JSIAudioOptimizationProblem(Problem):
         # Note: Don't store Console object directly to avoid serialization issues with pymoo
         self.jsi_evaluator = JSIFitnessEvaluator(
             oracle=self.oracle,
-            console=None  # Will create console when needed
+            console=None,  # Will create console when needed
+            show_live_ranking=show_live_ranking,
+            live_update_hz=live_update_hz
         )
-        self.show_live_ranking = show_live_ranking
 
         # Initialize genome mapper
         self.genome_mapper = GenomeToPhenotypeMapper()
@@ -101,6 +106,13 @@ class JSIAudioOptimizationProblem(Problem):
             # Step 1: Render audio using REAPER
             audio_paths = self._render_population_audio(solutions, session_name)
 
+            # Analyze all renders in parallel before the (sequential) JSI sort,
+            # or at least decode them concurrently when analysis is serial
+            if self.runner is not None:
+                self.oracle.precompute_frequencies(audio_paths.values(), runner=self.runner)
+            else:
+                self.oracle.preload(audio_paths.values())
+
             # Step 2: Use JSI + audio oracle to rank population
             fitness_values = self.jsi_evaluator.evaluate_population_fitness(
                 solutions, audio_paths, self.generation_counter
@@ -286,7 +298,9 @@ class MultiTargetJSIOptimizationProblem(JSIAudioOptimizationProblem):
         target_frequencies: List[float],
         session_name_prefix: str = "multi_jsi_audio_ga",
         oracle_noise_level: float = 0.05,
-        show_live_ranking: bool = True
+        show_live_ranking: bool = True,
+        live_update_hz: float = 1.0,
+        runner=None
     ):
         """Initialize multi-target JSI problem.
 
@@ -296,6 +310,8 @@ class MultiTargetJSIOptimizationProblem(JSIAudioOptimizationProblem):
             session_name_prefix: Session name prefix
             oracle_noise_level: Oracle noise level
             show_live_ranking: Whether to show live ranking
+            live_update_hz: Maximum number of live ranking updates per second
+            runner: Optional pymoo runner for parallel audio analysis
         """
         # Initialize with first target frequency
         super().__init__(
@@ -303,7 +319,9 @@ class MultiTargetJSIOptimizationProblem(JSIAudioOptimizationProblem):
             target_frequency=target_frequencies[0],
             session_name_prefix=session_name_prefix,
             oracle_noise_level=oracle_noise_level,
-            show_live_ranking=show_live_ranking
+            show_live_ranking=show_live_ranking,
+            live_update_hz=live_update_hz,
+            runner=runner
         )
 
         self.target_frequencies = target_frequencies
@@ -330,7 +348,8 @@ class HumanJSIAudioOptimizationProblem(JSIAudioOptimizationProblem):
         reaper_project_path: Path,
         human_oracle,  # HumanAudioComparisonOracle instance
         session_name_prefix: str = "human_jsi_audio_ga",
-        show_live_ranking: bool = True
+        show_live_ranking: bool = True,
+        genome_decimals: int = 6
     ):
         """Initialize human JSI audio optimization problem.
 
@@ -339,6 +358,8 @@ class HumanJSIAudioOptimizationProblem(JSIAudioOptimizationProblem):
             human_oracle: Human audio comparison oracle instance
             session_name_prefix: Prefix for session names
             show_live_ranking: Whether to show live JSI ranking updates
+            genome_decimals: Decimal places a genome is rounded to before
+                it is looked up in the render cache
         """
         # Define problem dimensions (same as parent)
         n_var = 2  # octave, fine
@@ -388,6 +409,61 @@ class HumanJSIAudioOptimizationProblem(JSIAudioOptimizationProblem):
         self.generation_counter = 0
         self.evaluation_count = 0
 
+        # Rendered audio of every genome seen so far
+        self.genome_decimals = genome_decimals
+        self._render_cache: Dict[bytes, Path] = {}
+
+    def _genome_key(self, individual: np.ndarray) -> bytes:
+        """Hash a decision vector, rounded to ``genome_decimals``."""
+        rounded = np.round(np.asarray(individual, dtype=np.float64), self.genome_decimals)
+        # Adding 0.0 turns -0.0 into 0.0 so both hash the same
+        return hashlib.blake2b((rounded + 0.0).tobytes(), digest_size=16).digest()
+
+    def _render_with_cache(
+        self,
+        x: np.ndarray,
+        solutions: List[Solution],
+        session_name: str
+    ) -> Dict[str, Path]:
+        """Render only the genomes that have no render from an earlier generation.
+
+        Fitness itself is not cached: it is a rank within the current
+        generation, so every individual still takes part in the comparisons.
+
+        Args:
+            x: Decision vectors of the population
+            solutions: Solutions built from ``x``
+            session_name: Name for this rendering session
+
+        Returns:
+            Dictionary mapping solution IDs to rendered audio paths
+        """
+        keys = [self._genome_key(individual) for individual in x]
+        audio_paths = {}
+        missing = []
+        for i, key in enumerate(keys):
+            cached = self._render_cache.get(key)
+            # Old render directories are cleaned up periodically
+            if cached is not None and cached.exists():
+                audio_paths[f"sol_{i:03d}"] = cached
+            else:
+                missing.append(i)
+
+        if len(missing) < len(keys):
+            print(f"Reusing {len(keys) - len(missing)} renders from earlier generations")
+
+        if missing:
+            rendered = self._render_population_audio(
+                [solutions[i] for i in missing], session_name
+            )
+            for j, i in enumerate(missing):
+                path = rendered.get(f"sol_{j:03d}")
+                if path is not None:
+                    audio_paths[f"sol_{i:03d}"] = path
+                    self._render_cache[keys[i]] = path
+
+        return audio_paths
+
     def _evaluate(self, x, out, *args, **kwargs):
         """Evaluate population using human JSI ranking."""
         self.generation_counter += 1
@@ -407,14 +483,22 @@ class HumanJSIAudioOptimizationProblem(JSIAudioOptimizationProblem):
         try:
             # Step 1: Render audio using REAPER
             print("Rendering audio samples...")
-            audio_paths = self._render_population_audio(solutions, session_name)
+            audio_paths = self._render_with_cache(x, solutions, session_name)
+
+            # Decode every render once; ranking plays each file many times
+            if hasattr(self.oracle, 'preload'):
+                self.oracle.preload(audio_paths.values())
 
             # Step 2: Use JSI + human oracle to rank population
             print("Starting human comparisons...")
-            ranked_solutions, fitness_values, ranking_info = self.population_ranker.rank_population_with_audio(
+            _, ranked_fitness, ranking_info = self.population_ranker.rank_population_with_audio(
                 solutions, audio_paths, self.generation_counter
             )
 
+            # Ranker output is best-first; pymoo needs one value per individual of x
+            fitness_values = np.empty(len(ranked_fitness))
+            fitness_values[ranking_info['ranked_indices']] = ranked_fitness
+
             # Update evaluation counter
             self.evaluation_count += len(solutions)
 
@@ -1,9 +1,12 @@
 """Human audio comparison oracle with PyQt5 GUI interface for user selection."""
 
+import hashlib
+import logging
 import pygame
 from pathlib import Path
-from typing import Any
-import sys
+from typing import Any, Iterable, MutableMapping, Optional
+
+from .playback import ensure_mixer
 
 try:
     from .pyqt_audio_oracle import PyQtAudioComparisonOracle
@@ -12,18 +15,26 @@ except ImportError:
     GUI_AVAILABLE = False
     PyQtAudioComparisonOracle = None
 
-sys.path.append(str(Path(__file__).parent.parent.parent / "choix_active_online"))
 from choix_active_online_demo.comparison_oracle import ComparisonOracle
 
+logger = logging.getLogger(__name__)
+
 
 class HumanAudioComparisonOracle(ComparisonOracle):
     """Oracle that presents audio files to human user for comparison via PyQt5 GUI."""
 
-    def __init__(self, window_title: str = "Audio Comparison"):
+    def __init__(
+        self,
+        window_title: str = "Audio Comparison",
+        answer_cache: Optional[MutableMapping] = None
+    ):
         """Initialize human audio comparison oracle.
 
         Args:
             window_title: Title for the comparison window
+            answer_cache: Mapping to store answers in; pass a
+                multiprocessing.Manager().dict() to share answers between
+                processes (defaults to a private dict)
         """
         self.window_title = window_title
         self.comparison_count = 0
@@ -33,11 +44,22 @@ class HumanAudioComparisonOracle(ComparisonOracle):
             self._oracle = PyQtAudioComparisonOracle(window_title)
         else:
             # Fallback to console mode
-            print("Warning: No GUI libraries available, using console mode")
+            logger.warning("No GUI libraries available, using console mode")
             self._oracle = None
 
-        # Initialize pygame mixer for audio playback
-        pygame.mixer.init(frequency=44100, size=-16, channels=2, buffer=512)
+        # Decoded sounds for the current generation (console mode only)
+        self._sound_cache = {}
+
+        # Answers already given, keyed by the content digests of both
+        # renders, so a repeated pair never prompts the user twice even when
+        # a genome was rendered again to a new path
+        self._answers = {} if answer_cache is None else answer_cache
+        self._digests = {}
+
+        # Only the console fallback plays through pygame; the PyQt oracle
+        # uses Qt's own audio, so the mixer is not opened behind it
+        if self._oracle is None:
+            ensure_mixer()
 
     def compare(self, item_a: Any, item_b: Any) -> bool:
         """Compare two audio items by presenting them to the user.
@@ -49,6 +71,11 @@ class HumanAudioComparisonOracle(ComparisonOracle):
         Returns:
             True if user selects item_a as better, False if item_b
         """
+        key = (self._render_digest(item_a), self._render_digest(item_b))
+        cached = self._answers.get(key)
+        if cached is not None:
+            return cached
+
         self.comparison_count += 1
 
         if self._oracle:
@@ -56,12 +83,46 @@ class HumanAudioComparisonOracle(ComparisonOracle):
             result = self._oracle.compare(item_a, item_b)
             # Sync comparison count (but don't overwrite, just increment)
             self.comparison_count = self._oracle.comparison_count
-            return result
         else:
             # Use console fallback
-            path_a = Path(item_a) if not isinstance(item_a, Path) else item_a
-            path_b = Path(item_b) if not isinstance(item_b, Path) else item_b
-            return self._console_fallback_comparison(path_a, path_b)
+            path_a = Path(item_a)
+            path_b = Path(item_b)
+            result = self._console_fallback_comparison(path_a, path_b)
+
+        self._answers[(key[1], key[0])] = not result
+        self._answers[key] = result
+        return result
+
+    def _render_digest(self, item: Any) -> str:
+        """Digest of an audio file's contents, computed once per path."""
+        path = str(item)
+        digest = self._digests.get(path)
+        if digest is None:
+            try:
+                digest = hashlib.blake2b(Path(path).read_bytes(), digest_size=16).hexdigest()
+            except OSError:
+                # Unreadable files can still be told apart by path
+                digest = path
+            self._digests[path] = digest
+        return digest
+
+    def preload(self, audio_paths: Iterable[Path]) -> None:
+        """Decode a generation's audio files up front for lag-free playback.
+
+        Args:
+            audio_paths: Audio files that will be compared
+        """
+        if self._oracle:
+            # The PyQt window loads each pair itself as it is shown
+            return
+
+        sounds = {}
+        for path in map(Path, audio_paths):
+            try:
+                sounds[path] = pygame.mixer.Sound(str(path))
+            except pygame.error as e:
+                logger.warning("Could not preload %s: %s", path.name, e)
+        self._sound_cache = sounds
 
     def get_comparison_count(self) -> int:
         """Get the number of comparisons made.
@@ -89,15 +150,18 @@ class HumanAudioComparisonOracle(ComparisonOracle):
         Returns:
             True if user selects A, False if user selects B
         """
-        print(f"\n=== Audio Comparison #{self.comparison_count} ===")
-        print(f"Option A: {path_a.name}")
-        print(f"Option B: {path_b.name}")
-        print("\nCommands:")
-        print("  'a' - Play option A")
-        print("  'b' - Play option B")
-        print("  's' - Stop audio")
-        print("  '1' - Choose option A")
-        print("  '2' - Choose option B")
+        # The prompt is interactive, so it goes straight to stdout in one write
+        print(
+            f"\n=== Audio Comparison #{self.comparison_count} ===\n"
+            f"Option A: {path_a.name}\n"
+            f"Option B: {path_b.name}\n"
+            "\nCommands:\n"
+            "  'a' - Play option A\n"
+            "  'b' - Play option B\n"
+            "  's' - Stop audio\n"
+            "  '1' - Choose option A\n"
+            "  '2' - Choose option B"
+        )
 
         while True:
             try:
@@ -128,17 +192,23 @@ class HumanAudioComparisonOracle(ComparisonOracle):
     def _play_audio(self, audio_path: Path) -> None:
         """Play audio file using pygame."""
         try:
+            pygame.mixer.stop()
             pygame.mixer.music.stop()
-            pygame.mixer.music.load(str(audio_path))
-            pygame.mixer.music.play()
-            print(f"Playing: {audio_path.name}")
+            sound = self._sound_cache.get(audio_path)
+            if sound is not None:
+                sound.play()
+            else:
+                pygame.mixer.music.load(str(audio_path))
+                pygame.mixer.music.play()
+            logger.info("Playing: %s", audio_path.name)
         except pygame.error as e:
-            print(f"Error playing {audio_path.name}: {e}")
+            logger.warning("Error playing %s: %s", audio_path.name, e)
 
     def _stop_audio(self) -> None:
         """Stop audio playback."""
         try:
+            pygame.mixer.stop()
             pygame.mixer.music.stop()
-            print("Audio stopped")
+            logger.info("Audio stopped")
         except pygame.error as e:
-            print(f"Error stopping audio: {e}")
+            logger.warning("Error stopping audio: %s", e)
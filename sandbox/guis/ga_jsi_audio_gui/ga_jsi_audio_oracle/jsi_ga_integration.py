@@ -1,30 +1,43 @@
 """Integration of JSI adaptive quicksort with genetic algorithm populations."""
 
+import io
+import itertools
+import logging
+import re
 import time
+import weakref
 from typing import List, Dict, Any, Optional, Tuple
 from pathlib import Path
 import numpy as np
 from rich.console import Console
 
-import sys
-from pathlib import Path
-sys.path.append(str(Path(__file__).parent.parent.parent / "choix_active_online"))
-sys.path.append(str(Path(__file__).parent.parent.parent / "pymoo_ga_freq_reaper"))
-
 from choix_active_online_demo.comparison_oracle import ComparisonOracle
 from choix_active_online_demo.ranking_tracker import SimpleRankingTracker
 from choix_active_online_demo.display_utils import create_ranking_table
 from ga_frequency_demo.genetics import Solution
 
+logger = logging.getLogger(__name__)
+
+# Oracles of rankers in this process, keyed by the token each ranker pickles
+# in place of its oracle (which may hold GUI, audio or large cache state).
+# A copied or unpickled ranker looks its own token up here. References are
+# weak, so an oracle is still freed once its problem is gone
+_oracles = weakref.WeakValueDictionary()
+_oracle_tokens = itertools.count()
+
 
 class GAPopulationRanker:
     """JSI-based ranking system for GA populations using audio comparisons."""
 
+    # Live ranking tables are redrawn only when these leading places change
+    LIVE_TOP_K = 5
+
     def __init__(
         self,
         oracle: ComparisonOracle,
         console: Optional[Console] = None,
-        show_live_ranking: bool = True
+        show_live_ranking: bool = True,
+        live_update_hz: float = 1.0
     ):
         """Initialize GA population ranker.
 
@@ -32,13 +45,54 @@ class GAPopulationRanker:
             oracle: Comparison oracle for pairwise comparisons
             console: Optional Rich console for live display (not stored to avoid serialization issues)
             show_live_ranking: Whether to show live ranking updates
+            live_update_hz: Maximum number of live ranking updates per second
         """
         self.oracle = oracle
         self.show_live_ranking = show_live_ranking
+        self.live_update_hz = live_update_hz
+        self._last_emit_ts = 0.0
+        self._last_top = None
+        # Digit run -> path index over the audio_paths dict last searched
+        self._indexed_paths = None
+        self._suffix_index = {}
         self.comparison_count = 0
         self.generation_count = 0
         # Don't store console to avoid serialization issues with pymoo
 
+    def __getstate__(self):
+        """Pickle only the ranker's settings and counters, never the oracle."""
+        state = self.__dict__.copy()
+        del state['_oracle']
+        # Per-call lookup state, rebuilt on the next ranking
+        state['_indexed_paths'] = None
+        state['_suffix_index'] = {}
+        return state
+
+    def __setstate__(self, state):
+        """Restore settings and reattach the original oracle if it lives in this process.
+
+        In any other process the oracle stays unset until it is assigned.
+        """
+        self.__dict__.update(state)
+        self._oracle = _oracles.get(self._oracle_token)
+
+    @property
+    def oracle(self) -> ComparisonOracle:
+        """Comparison oracle used for pairwise comparisons."""
+        if self._oracle is None:
+            raise RuntimeError(
+                "GAPopulationRanker has no oracle: it was unpickled in a process "
+                "where its oracle does not exist; assign ranker.oracle first"
+            )
+        return self._oracle
+
+    @oracle.setter
+    def oracle(self, oracle: ComparisonOracle) -> None:
+        self._oracle = oracle
+        self._oracle_token = next(_oracle_tokens)
+        if oracle is not None:
+            _oracles[self._oracle_token] = oracle
+
     def rank_population_with_audio(
         self,
         solutions: List[Solution],
@@ -58,6 +112,11 @@ class GAPopulationRanker:
         if generation is not None:
             self.generation_count = generation
 
+        # audio_paths may be a reused dict with new contents; index it afresh
+        self._indexed_paths = None
+        # A new generation always gets its first live table
+        self._last_top = None
+
         # Create solution IDs for tracking
         solution_ids = [f"sol_{i:03d}" for i in range(len(solutions))]
 
@@ -69,10 +128,17 @@ class GAPopulationRanker:
         valid_ids = []
         valid_paths = {}
 
+        # Fuzzy matching can resolve several ids to one file; stat each once
+        path_exists = {}
+
         for i, (solution, sol_id) in enumerate(zip(solutions, solution_ids)):
             # Look for matching audio path
             matching_path = self._find_matching_audio_path(sol_id, audio_paths)
-            if matching_path and matching_path.exists():
+            if matching_path is None:
+                continue
+            if matching_path not in path_exists:
+                path_exists[matching_path] = matching_path.exists()
+            if path_exists[matching_path]:
                 valid_solutions.append(solution)
                 valid_ids.append(sol_id)
                 valid_paths[sol_id] = matching_path
@@ -91,30 +157,33 @@ class GAPopulationRanker:
             tracker
         )
 
-        # Convert back to solutions and calculate fitness
-        ranked_solutions = []
-        fitness_values = []
-
-        for rank, sol_id in enumerate(ranked_ids):
-            # Find corresponding solution
-            idx = valid_ids.index(sol_id)
-            solution = valid_solutions[idx]
+        # The generation's final order, even inside the rate limit, so the
+        # last table shown is never a stale one
+        if self.show_live_ranking:
+            self._show_live_ranking(tracker, force=True)
 
-            # Convert rank to fitness (lower rank = better fitness)
-            # Use exponential decay to create meaningful fitness differences
-            fitness = np.exp(-rank * 0.5)  # Higher rank gets lower fitness
+        # Convert back to solutions and calculate fitness
+        id_to_solution = dict(zip(valid_ids, valid_solutions))
+        valid_id_set = set(valid_ids)
+        ranked_solutions = [id_to_solution[sol_id] for sol_id in ranked_ids]
 
-            ranked_solutions.append(solution)
-            fitness_values.append(fitness)
+        # Convert rank to fitness (lower rank = better fitness)
+        # Use exponential decay to create meaningful fitness differences
+        fitness_values = np.exp(-0.5 * np.arange(len(ranked_ids))).tolist()
 
         # Add back invalid solutions with penalty fitness
         penalty_fitness = 0.01  # Very low fitness for missing audio
         for i, solution in enumerate(solutions):
             sol_id = solution_ids[i]
-            if sol_id not in valid_ids:
+            if sol_id not in valid_id_set:
                 ranked_solutions.append(solution)
                 fitness_values.append(penalty_fitness)
 
+        # Position in `solutions` of each entry of ranked_solutions
+        ranked_indices = [int(sol_id[4:]) for sol_id in ranked_ids] + [
+            i for i, sol_id in enumerate(solution_ids) if sol_id not in valid_id_set
+        ]
+
         # Get final ranking information
         if len(valid_solutions) >= 3:
             bt_ranking, confidence, strengths = tracker.get_bt_ranking_with_confidence()
@@ -129,7 +198,8 @@ class GAPopulationRanker:
             'strengths': strengths,
             'comparisons_made': self.comparison_count,
             'valid_solutions': len(valid_solutions),
-            'total_solutions': len(solutions)
+            'total_solutions': len(solutions),
+            'ranked_indices': ranked_indices
         }
 
         print(f"Ranking complete: {self.comparison_count} comparisons, confidence: {confidence:.3f}")
@@ -152,46 +222,65 @@ class GAPopulationRanker:
         Returns:
             List of solution IDs in ranked order (best to worst)
         """
-        if len(solution_ids) <= 1:
-            return solution_ids.copy()
-
-        # Choose pivot (first item)
-        pivot = solution_ids[0]
-        rest = solution_ids[1:]
-
-        # Partition around pivot
-        better = []  # Items better than pivot
-        worse = []   # Items worse than pivot
-
-        for sol_id in rest:
-            # Make audio comparison
+        # Random pivots keep the expected number of comparisons at
+        # O(N log N) even for populations that arrive already sorted; seeding
+        # by generation keeps a run reproducible
+        rng = np.random.default_rng(self.generation_count)
+
+        ranked = []
+        # Work stack of partitions still to sort and pivots already placed,
+        # popped so that better items come out before their pivot and worse
+        # ones after it (the order of the recursive formulation)
+        stack = [list(solution_ids)]
+
+        while stack:
+            segment = stack.pop()
+            if isinstance(segment, str):
+                ranked.append(segment)
+                continue
+            if len(segment) <= 1:
+                ranked.extend(segment)
+                continue
+
+            # Choose pivot (uniformly at random)
+            pivot_idx = int(rng.integers(len(segment)))
+            pivot = segment[pivot_idx]
+            rest = segment[:pivot_idx] + segment[pivot_idx + 1:]
+
+            # Every comparison against the pivot is independent, so they go
+            # to the oracle as one batch; compare_batch is True where the
+            # item beats the pivot
             pivot_path = audio_paths[pivot]
-            item_path = audio_paths[sol_id]
-
-            # oracle.compare returns True if first item is better
-            if self.oracle.compare(item_path, pivot_path):
-                # sol_id is better than pivot
-                better.append(sol_id)
-                winner = sol_id
-            else:
-                # pivot is better than or equal to sol_id
-                worse.append(sol_id)
-                winner = pivot
-
-            # Record comparison for Bradley-Terry model
-            tracker.add_comparison(sol_id, pivot, winner)
-            self.comparison_count += 1
-
-            # Show live ranking if enabled
-            if self.show_live_ranking and self.comparison_count % 5 == 0:
+            results = self.oracle.compare_batch(
+                [audio_paths[sol_id] for sol_id in rest],
+                [pivot_path] * len(rest)
+            )
+
+            # Partition around pivot
+            better = []  # Items better than pivot
+            worse = []   # Items worse than pivot
+            for sol_id, item_wins in zip(rest, results):
+                if item_wins:
+                    better.append(sol_id)
+                    winner = sol_id
+                else:
+                    # pivot is better than or equal to sol_id
+                    worse.append(sol_id)
+                    winner = pivot
+
+                # Record comparison for Bradley-Terry model
+                tracker.add_comparison(sol_id, pivot, winner)
+                self.comparison_count += 1
+
+            # Show live ranking if enabled (rate-limited inside)
+            if self.show_live_ranking:
                 self._show_live_ranking(tracker)
 
-        # Recursively sort partitions
-        sorted_better = self._adaptive_quicksort_audio(better, audio_paths, tracker)
-        sorted_worse = self._adaptive_quicksort_audio(worse, audio_paths, tracker)
+            stack.append(worse)
+            stack.append(pivot)
+            stack.append(better)
 
-        # Return in order: better items, pivot, worse items
-        return sorted_better + [pivot] + sorted_worse
+        return ranked
 
     def _find_matching_audio_path(
         self,
@@ -211,44 +300,54 @@ class GAPopulationRanker:
         if solution_id in audio_paths:
             return audio_paths[solution_id]
 
-        # Fuzzy match - look for solution ID in path keys
-        for path_key, path in audio_paths.items():
-            if solution_id in path_key or path_key in solution_id:
-                return path
-
-        # Try extracting individual number from solution_id
-        try:
-            sol_num = solution_id.split('_')[-1]  # Get number part
+        # Fuzzy match on the individual number, e.g. sol_001 -> individual_001_gen_1
+        if self._indexed_paths is not audio_paths:
+            self._suffix_index = {}
             for path_key, path in audio_paths.items():
-                if sol_num in path_key:
-                    return path
-        except (IndexError, ValueError):
-            pass
+                for digits in re.findall(r'\d+', path_key):
+                    self._suffix_index.setdefault(digits, path)
+            self._indexed_paths = audio_paths
+
+        sol_num = re.findall(r'\d+', solution_id)
+        if not sol_num:
+            return None
+        return self._suffix_index.get(sol_num[-1])
 
-        return None
+    def _show_live_ranking(self, tracker: SimpleRankingTracker, force: bool = False) -> None:
+        """Log a live ranking table, at most live_update_hz times per second.
 
-    def _show_live_ranking(self, tracker: SimpleRankingTracker) -> None:
-        """Display live ranking updates.
+        A table is only logged when the top LIVE_TOP_K places differ from
+        the last one shown.
 
         Args:
             tracker: Current ranking tracker
+            force: Log the table regardless of the rate limit and top places
         """
         if not self.show_live_ranking:
             return
 
-        # Create console locally to avoid serialization issues
-        from rich.console import Console
-        console = Console()
+        now = time.monotonic()
+        if not force and now - self._last_emit_ts <= 1.0 / self.live_update_hz:
+            return
 
         current_ranking = tracker.get_simple_ranking()
+        top = tuple(current_ranking[:self.LIVE_TOP_K])
+        if not force and top == self._last_top:
+            return
+        self._last_emit_ts = now
+        self._last_top = top
+
+        # Render into a buffer so the table goes out as a single log record
+        buffer = io.StringIO()
+        console = Console(file=buffer, width=100)
+
         table = create_ranking_table(
             current_ranking,
             title=f"Live JSI Ranking (Gen {self.generation_count}, {self.comparison_count} comparisons)"
         )
 
-        console.clear()
         console.print(table)
-        time.sleep(0.1)  # Brief pause for visibility
+        logger.info("\n" + buffer.getvalue())
 
     def _fallback_ranking(
         self,
@@ -273,7 +372,8 @@ class GAPopulationRanker:
             'strengths': {},
             'comparisons_made': 0,
             'valid_solutions': 0,
-            'total_solutions': len(solutions)
+            'total_solutions': len(solutions),
+            'ranked_indices': list(range(len(solutions)))
         }
 
         return solutions, fitness_values, ranking_info
@@ -286,7 +386,9 @@ class JSIFitnessEvaluator:
         self,
         oracle: ComparisonOracle,
         console: Optional[Console] = None,
-        fitness_normalization: str = "exponential"
+        fitness_normalization: str = "exponential",
+        show_live_ranking: bool = True,
+        live_update_hz: float = 1.0
     ):
         """Initialize JSI fitness evaluator.
 
@@ -294,8 +396,15 @@ class JSIFitnessEvaluator:
             oracle: Comparison oracle for audio comparisons
             console: Optional console for display
             fitness_normalization: Method for converting ranks to fitness ("exponential", "linear", "inverse")
+            show_live_ranking: Whether the ranker renders live ranking tables
+            live_update_hz: Maximum number of live ranking updates per second
         """
-        self.ranker = GAPopulationRanker(oracle, console)
+        self.ranker = GAPopulationRanker(
+            oracle,
+            console,
+            show_live_ranking=show_live_ranking,
+            live_update_hz=live_update_hz
+        )
         self.fitness_normalization = fitness_normalization
 
     def evaluate_population_fitness(
@@ -312,25 +421,32 @@ class JSIFitnessEvaluator:
             generation: Current generation number
 
         Returns:
-            List of fitness values (higher is better for maximization)
+            List of fitness values (higher is better for maximization), one
+            per solution in the order given
         """
         _, fitness_values, ranking_info = self.ranker.rank_population_with_audio(
             solutions, audio_paths, generation
         )
 
-        # Normalize fitness values based on selected method
-        if self.fitness_normalization == "exponential":
-            # Already done in ranker
-            pass
-        elif self.fitness_normalization == "linear":
+        # Normalize fitness values (listed best rank first) based on selected method
+        n = len(fitness_values)
+        if self.fitness_normalization == "linear":
             # Linear decrease from 1.0 to 0.1
-            n = len(fitness_values)
-            fitness_values = [1.0 - 0.9 * i / max(1, n - 1) for i in range(n)]
+            ranked_fitness = np.linspace(1.0, 0.1, n) if n > 1 else np.ones(n)
         elif self.fitness_normalization == "inverse":
             # Inverse of rank + 1
-            fitness_values = [1.0 / (i + 1) for i in range(len(fitness_values))]
-
-        return fitness_values
+            ranked_fitness = 1.0 / (np.arange(n) + 1)
+        else:
+            # Exponential: already done in ranker
+            ranked_fitness = np.asarray(fitness_values, dtype=np.float64)
+
+        # Scatter back from rank order to the order of `solutions`
+        ranked_indices = ranking_info.get('ranked_indices')
+        if ranked_indices is None:
+            return ranked_fitness.tolist()
+        fitness = np.empty(n)
+        fitness[ranked_indices] = ranked_fitness
+        return fitness.tolist()
 
     def get_ranking_info(self) -> Dict[str, Any]:
         """Get information about the last ranking operation.
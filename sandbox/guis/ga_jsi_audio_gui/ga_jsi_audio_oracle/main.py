@@ -1,20 +1,106 @@
 """Main orchestration for GA + JSI + Audio Oracle + REAPER integration demo."""
 
+import logging
+import os
 import time
+from concurrent.futures import ProcessPoolExecutor
+from io import StringIO
+from itertools import combinations, islice, repeat
+from multiprocessing import Pool
 from pathlib import Path
 from typing import Dict, Any, Optional
 import numpy as np
 
 from pymoo.algorithms.soo.nonconvex.ga import GA
+from pymoo.core.callback import Callback
+from pymoo.core.problem import StarmapParallelization
 from pymoo.operators.crossover.sbx import SBX
 from pymoo.operators.mutation.pm import PM
 from pymoo.operators.sampling.rnd import FloatRandomSampling
 from pymoo.optimize import minimize
 from pymoo.termination import get_termination
+from pymoo.termination.collection import TerminationCollection
+from pymoo.termination.max_gen import MaximumGenerationTermination
+from pymoo.termination.robust import RobustTermination
+from pymoo.termination.xtol import DesignSpaceTermination
 
 from .ga_problem import JSIAudioOptimizationProblem, MultiTargetJSIOptimizationProblem
 from .audio_oracle import AudioComparisonOracle, FrequencyTargetOracle
 
+logger = logging.getLogger(__name__)
+
+
+class GenerationLogCallback(Callback):
+    """pymoo callback that reports generation progress through the module logger.
+
+    Log handlers are flushed after every generation, so buffered output
+    appears as the run progresses.
+
+    With record_history, also keeps (generation, best F) pairs in self.history
+    as a lightweight stand-in for pymoo's save_history, which deep-copies the
+    algorithm (and with it the problem and oracle caches) every generation.
+    """
+
+    def __init__(self, record_history: bool = False):
+        super().__init__()
+        self.record_history = record_history
+        self.history = []
+
+    def notify(self, algorithm):
+        best = algorithm.pop.get("F").min() if algorithm.pop is not None else float("nan")
+        if self.record_history:
+            self.history.append((algorithm.n_gen, float(best)))
+        logger.info(
+            f"Generation {algorithm.n_gen}: evaluations={algorithm.evaluator.n_eval}, "
+            f"best F={best:.6f}"
+        )
+        # Release records held by buffering handlers (such as the demo's
+        # MemoryHandler) so the generation's live ranking is shown now
+        for handler in logging.getLogger().handlers:
+            handler.flush()
+
+
+def _stagnation_termination(
+    n_generations: int,
+    xtol: float = 1e-4,
+    period: int = 5
+) -> TerminationCollection:
+    """Stop once the population stops moving, with n_generations as a hard cap.
+
+    JSI fitness is rank-based, so the best F is the same every generation and
+    an objective-space (ftol) criterion would fire immediately. Stagnation is
+    therefore detected in design space only.
+
+    Args:
+        n_generations: Maximum number of generations
+        xtol: Design-space movement below which a generation counts as stalled
+        period: Consecutive stalled generations required to stop
+
+    Returns:
+        Termination criterion for pymoo's minimize
+    """
+    return TerminationCollection(
+        RobustTermination(DesignSpaceTermination(tol=xtol), period=period),
+        MaximumGenerationTermination(n_generations),
+    )
+
+
+def _create_analysis_pool(population_size: int, n_workers: Optional[int]) -> Optional[Pool]:
+    """Create a process pool for per-generation audio analysis.
+
+    Args:
+        population_size: Size of GA population
+        n_workers: Requested worker count (None = one per core, capped at population size)
+
+    Returns:
+        Process pool, or None when analysis should run serially
+    """
+    if n_workers is None:
+        n_workers = min(population_size, os.cpu_count() or 1)
+    if n_workers <= 1:
+        return None
+    return Pool(processes=n_workers)
+
 
 def demo_jsi_audio_optimization(
     reaper_project_path: Path,
@@ -23,7 +109,10 @@ def demo_jsi_audio_optimization(
     n_generations: int = 10,
     population_size: int = 8,
     oracle_noise_level: float = 0.05,
-    show_live_ranking: bool = True
+    show_live_ranking: bool = True,
+    live_update_hz: float = 1.0,
+    n_workers: Optional[int] = None,
+    record_history: bool = False
 ) -> Dict[str, Any]:
     """Run JSI + Audio Oracle optimization demo.
 
@@ -35,111 +124,136 @@ def demo_jsi_audio_optimization(
         population_size: Size of GA population
         oracle_noise_level: Noise level for oracle decisions (0.0 = perfect, 1.0 = random)
         show_live_ranking: Whether to show live JSI ranking updates
+        live_update_hz: Maximum number of live ranking updates per second
+        n_workers: Processes for parallel audio analysis (None = one per core)
+        record_history: Whether to record the best fitness of every generation
 
     Returns:
         Dictionary with optimization results
     """
-    print("=== GA + JSI + Audio Oracle Integration Demo ===")
-    print(f"REAPER project: {reaper_project_path}")
-    print(f"Target frequency: {target_frequency} Hz")
-    print(f"Target audio: {target_audio_path or 'None (using frequency)'}")
-    print(f"Generations: {n_generations}, Population: {population_size}")
-    print(f"Oracle noise level: {oracle_noise_level}")
-    print(f"Live ranking: {show_live_ranking}")
+    logger.info(
+        "=== GA + JSI + Audio Oracle Integration Demo ===\n"
+        f"REAPER project: {reaper_project_path}\n"
+        f"Target frequency: {target_frequency} Hz\n"
+        f"Target audio: {target_audio_path or 'None (using frequency)'}\n"
+        f"Generations: {n_generations}, Population: {population_size}\n"
+        f"Oracle noise level: {oracle_noise_level}\n"
+        f"Live ranking: {show_live_ranking}"
+    )
 
     # Validate REAPER project
     if not reaper_project_path.exists():
         raise FileNotFoundError(f"REAPER project not found: {reaper_project_path}")
 
-    # Create optimization problem
-    problem = JSIAudioOptimizationProblem(
-        reaper_project_path=reaper_project_path,
-        target_frequency=target_frequency,
-        target_audio_path=target_audio_path,
-        session_name_prefix="jsi_audio_demo",
-        oracle_noise_level=oracle_noise_level,
-        show_live_ranking=show_live_ranking
-    )
-
-    # Configure genetic algorithm
-    algorithm = GA(
-        pop_size=population_size,
-        sampling=FloatRandomSampling(),
-        crossover=SBX(prob=0.9, eta=15),
-        mutation=PM(prob=0.1, eta=20),
-        eliminate_duplicates=True
-    )
-
-    # Set termination criteria
-    termination = get_termination("n_gen", n_generations)
-
-    print(f"\nStarting optimization...")
-    start_time = time.time()
-
+    pool = _create_analysis_pool(population_size, n_workers)
     try:
-        # Run optimization
-        result = minimize(
-            problem=problem,
-            algorithm=algorithm,
-            termination=termination,
-            verbose=True,
-            save_history=True
-        )
-
-        end_time = time.time()
-        duration = end_time - start_time
-
-        print(f"\nOptimization completed in {duration:.2f} seconds")
-
-        # Extract best solution information
-        best_info = problem.get_best_solution_info(result)
+        runner = StarmapParallelization(pool.starmap) if pool else None
 
-        # Compile results
-        results = {
-            'success': True,
-            'best_info': best_info,
-            'duration_seconds': duration,
-            'target_frequency': target_frequency,
-            'target_audio_path': str(target_audio_path) if target_audio_path else None,
-            'oracle_noise_level': oracle_noise_level,
-            'generations_completed': problem.generation_counter,
-            'total_evaluations': problem.evaluation_count,
-            'population_size': population_size,
-            'result': result
-        }
-
-        # Print summary
-        print("\n" + "="*60)
-        print("OPTIMIZATION SUMMARY")
-        print("="*60)
-
-        if best_info:
-            print(f"Best solution: {best_info['solution']}")
-            print(f"Best fitness: {best_info['fitness']:.6f}")
-            print(f"Frequency ratio: {best_info['frequency_ratio']:.6f}")
-            print(f"Total evaluations: {best_info['evaluations']}")
-            print(f"JSI comparisons: {best_info.get('jsi_comparisons', 'N/A')}")
-
-        print(f"Optimization time: {duration:.2f} seconds")
-        print(f"Generations completed: {problem.generation_counter}")
-
-        # Clear oracle cache to free memory
-        problem.clear_oracle_cache()
-
-        return results
+        # Create optimization problem
+        problem = JSIAudioOptimizationProblem(
+            reaper_project_path=reaper_project_path,
+            target_frequency=target_frequency,
+            target_audio_path=target_audio_path,
+            session_name_prefix="jsi_audio_demo",
+            oracle_noise_level=oracle_noise_level,
+            show_live_ranking=show_live_ranking,
+            live_update_hz=live_update_hz,
+            runner=runner
+        )
 
-    except Exception as e:
-        print(f"Optimization failed: {e}")
-        import traceback
-        traceback.print_exc()
+        # Configure genetic algorithm
+        algorithm = GA(
+            pop_size=population_size,
+            sampling=FloatRandomSampling(),
+            crossover=SBX(prob=0.9, eta=15),
+            mutation=PM(prob=0.1, eta=20),
+            eliminate_duplicates=True
+        )
 
-        return {
-            'success': False,
-            'error': str(e),
-            'duration_seconds': time.time() - start_time,
-            'generations_completed': problem.generation_counter,
-            'total_evaluations': problem.evaluation_count
-        }
+        # Stop early once the population has converged
+        termination = _stagnation_termination(n_generations)
+
+        callback = GenerationLogCallback(record_history=record_history)
+
+        logger.info("Starting optimization...")
+        start_time = time.time()
+
+        try:
+            # Run optimization
+            result = minimize(
+                problem=problem,
+                algorithm=algorithm,
+                termination=termination,
+                callback=callback,
+                verbose=False,
+                save_history=False
+            )
+
+            end_time = time.time()
+            duration = end_time - start_time
+
+            logger.info(f"Optimization completed in {duration:.2f} seconds")
+
+            # Extract best solution information
+            best_info = problem.get_best_solution_info(result)
+
+            # Drop the result's references to the problem so the oracle and its
+            # audio cache can be collected once the caller is done with it
+            result.problem = None
+            result.algorithm = None
+
+            # Compile results
+            results = {
+                'success': True,
+                'best_info': best_info,
+                'duration_seconds': duration,
+                'target_frequency': target_frequency,
+                'target_audio_path': str(target_audio_path) if target_audio_path else None,
+                'oracle_noise_level': oracle_noise_level,
+                'generations_completed': problem.generation_counter,
+                'total_evaluations': problem.evaluation_count,
+                'population_size': population_size,
+                'history': callback.history,
+                'result': result
+            }
+
+            # Log summary as a single record
+            summary = StringIO()
+            summary.write("=" * 60 + "\n")
+            summary.write("OPTIMIZATION SUMMARY\n")
+            summary.write("=" * 60 + "\n")
+
+            if best_info:
+                summary.write(f"Best solution: {best_info['solution']}\n")
+                summary.write(f"Best fitness: {best_info['fitness']:.6f}\n")
+                summary.write(f"Frequency ratio: {best_info['frequency_ratio']:.6f}\n")
+                summary.write(f"Total evaluations: {best_info['evaluations']}\n")
+                summary.write(f"JSI comparisons: {best_info.get('jsi_comparisons', 'N/A')}\n")
+
+            summary.write(f"Optimization time: {duration:.2f} seconds\n")
+            summary.write(f"Generations completed: {problem.generation_counter}")
+            logger.info(summary.getvalue())
+
+            # Clear oracle cache to free memory
+            problem.clear_oracle_cache()
+
+            return results
+
+        except Exception as e:
+            logger.exception(f"Optimization failed: {e}")
+
+            return {
+                'success': False,
+                'error': str(e),
+                'duration_seconds': time.time() - start_time,
+                'generations_completed': problem.generation_counter,
+                'total_evaluations': problem.evaluation_count
+            }
+
+    finally:
+        if pool:
+            pool.close()
+            pool.join()
 
 
 def demo_multi_target_optimization(
@@ -147,7 +261,9 @@ def demo_multi_target_optimization(
     target_frequencies: list = None,
     n_generations: int = 20,
     population_size: int = 8,
-    oracle_noise_level: float = 0.05
+    oracle_noise_level: float = 0.05,
+    n_workers: Optional[int] = None,
+    record_history: bool = False
 ) -> Dict[str, Any]:
     """Run multi-target JSI optimization demo.
 
@@ -157,6 +273,8 @@ def demo_multi_target_optimization(
         n_generations: Number of GA generations
         population_size: Size of GA population
         oracle_noise_level: Oracle noise level
+        n_workers: Processes for parallel audio analysis (None = one per core)
+        record_history: Whether to record the best fitness of every generation
 
     Returns:
         Dictionary with optimization results
@@ -164,78 +282,167 @@ def demo_multi_target_optimization(
     if target_frequencies is None:
         target_frequencies = [440.0, 523.25, 659.25, 783.99]  # A4, C5, E5, G5
 
-    print("=== Multi-Target JSI Audio Optimization Demo ===")
-    print(f"Target frequencies: {target_frequencies} Hz")
-
-    # Create multi-target problem
-    problem = MultiTargetJSIOptimizationProblem(
-        reaper_project_path=reaper_project_path,
-        target_frequencies=target_frequencies,
-        session_name_prefix="multi_jsi_demo",
-        oracle_noise_level=oracle_noise_level,
-        show_live_ranking=True
+    logger.info(
+        "=== Multi-Target JSI Audio Optimization Demo ===\n"
+        f"Target frequencies: {target_frequencies} Hz"
     )
 
-    # Configure algorithm
-    algorithm = GA(
-        pop_size=population_size,
-        sampling=FloatRandomSampling(),
-        crossover=SBX(prob=0.9, eta=15),
-        mutation=PM(prob=0.1, eta=20),
-        eliminate_duplicates=True
-    )
-
-    termination = get_termination("n_gen", n_generations)
-
-    print(f"\nStarting multi-target optimization...")
-    start_time = time.time()
-
+    pool = _create_analysis_pool(population_size, n_workers)
     try:
-        result = minimize(
-            problem=problem,
-            algorithm=algorithm,
-            termination=termination,
-            verbose=True,
-            save_history=True
-        )
+        runner = StarmapParallelization(pool.starmap) if pool else None
 
-        end_time = time.time()
-        duration = end_time - start_time
+        # Create multi-target problem
+        problem = MultiTargetJSIOptimizationProblem(
+            reaper_project_path=reaper_project_path,
+            target_frequencies=target_frequencies,
+            session_name_prefix="multi_jsi_demo",
+            oracle_noise_level=oracle_noise_level,
+            show_live_ranking=True,
+            runner=runner
+        )
 
-        best_info = problem.get_best_solution_info(result)
+        # Configure algorithm
+        algorithm = GA(
+            pop_size=population_size,
+            sampling=FloatRandomSampling(),
+            crossover=SBX(prob=0.9, eta=15),
+            mutation=PM(prob=0.1, eta=20),
+            eliminate_duplicates=True
+        )
 
-        results = {
-            'success': True,
-            'best_info': best_info,
-            'duration_seconds': duration,
-            'target_frequencies': target_frequencies,
-            'generations_completed': problem.generation_counter,
-            'total_evaluations': problem.evaluation_count,
-            'result': result
-        }
+        # Fixed length: the target rotates every 5 generations, so the population
+        # settling on one target must not end the run
+        termination = get_termination("n_gen", n_generations)
+
+        callback = GenerationLogCallback(record_history=record_history)
+
+        logger.info("Starting multi-target optimization...")
+        start_time = time.time()
+
+        try:
+            result = minimize(
+                problem=problem,
+                algorithm=algorithm,
+                termination=termination,
+                callback=callback,
+                verbose=False,
+                save_history=False
+            )
+
+            end_time = time.time()
+            duration = end_time - start_time
+
+            best_info = problem.get_best_solution_info(result)
+
+            # Drop the result's references to the problem so the oracle and its
+            # audio cache can be collected once the caller is done with it
+            result.problem = None
+            result.algorithm = None
+
+            results = {
+                'success': True,
+                'best_info': best_info,
+                'duration_seconds': duration,
+                'target_frequencies': target_frequencies,
+                'generations_completed': problem.generation_counter,
+                'total_evaluations': problem.evaluation_count,
+                'history': callback.history,
+                'result': result
+            }
+
+            summary = StringIO()
+            summary.write(f"Multi-target optimization completed in {duration:.2f} seconds")
+            if best_info:
+                summary.write(f"\nFinal best solution: {best_info['solution']}")
+                summary.write(f"\nFinal frequency ratio: {best_info['frequency_ratio']:.6f}")
+            logger.info(summary.getvalue())
+
+            problem.clear_oracle_cache()
+            return results
+
+        except Exception as e:
+            logger.exception(f"Multi-target optimization failed: {e}")
+            return {
+                'success': False,
+                'error': str(e),
+                'duration_seconds': time.time() - start_time
+            }
+
+    finally:
+        if pool:
+            pool.close()
+            pool.join()
+
+
+def _eval_one_noise(
+    noise_level: float,
+    target_frequency: float,
+    test_frequencies: list,
+    n_comparisons: int,
+    seed: int,
+    oracle: Optional[AudioComparisonOracle] = None
+) -> Dict[str, Any]:
+    """Measure oracle accuracy at a single noise level.
 
-        print(f"\nMulti-target optimization completed in {duration:.2f} seconds")
-        if best_info:
-            print(f"Final best solution: {best_info['solution']}")
-            print(f"Final frequency ratio: {best_info['frequency_ratio']:.6f}")
+    Takes only primitive arguments so it can run in a worker process, where
+    the oracle is rebuilt locally. A serial caller can pass a shared oracle
+    instead to keep its caches across levels.
 
-        problem.clear_oracle_cache()
-        return results
+    Args:
+        noise_level: Noise level to test
+        target_frequency: Target frequency for comparisons
+        test_frequencies: Frequencies to compare (stand-ins for audio files)
+        n_comparisons: Number of comparisons
+        seed: Seed for the oracle's noise draws
+        oracle: Optional existing oracle to reuse
 
-    except Exception as e:
-        print(f"Multi-target optimization failed: {e}")
-        return {
-            'success': False,
-            'error': str(e),
-            'duration_seconds': time.time() - start_time
-        }
+    Returns:
+        Dictionary with accuracy, correct_decisions and total_decisions
+    """
+    if oracle is None:
+        oracle = AudioComparisonOracle(
+            target_frequency=target_frequency,
+            noise_level=noise_level,
+            random_seed=seed
+        )
+    else:
+        oracle.set_noise_level(noise_level)
+        # Same draws as a freshly seeded oracle
+        oracle.rng = np.random.Generator(np.random.SFC64(seed))
+
+    # Ground truth for every pair at once: freq closer to target should win
+    freqs = np.array(test_frequencies, dtype=np.float64)
+    dists = np.abs(freqs - target_frequency)
+    expected = dists[:, None] < dists[None, :]
+
+    # Each unordered pair once, exactly n_comparisons (or all pairs if fewer)
+    pairs = np.array(
+        list(islice(combinations(range(len(freqs)), 2), n_comparisons)),
+        dtype=np.intp
+    ).reshape(-1, 2)
+    rows, cols = pairs[:, 0], pairs[:, 1]
+
+    # Oracle decisions for all pairs in one batch (using frequency as mock audio)
+    # In real usage, these would be audio file paths
+    oracle_decisions = oracle.compare_batch(freqs[rows], freqs[cols])
+
+    correct_decisions = int(np.sum(oracle_decisions == expected[rows, cols]))
+    total_decisions = len(oracle_decisions)
+
+    accuracy = correct_decisions / total_decisions if total_decisions > 0 else 0.0
+    return {
+        'accuracy': accuracy,
+        'correct_decisions': correct_decisions,
+        'total_decisions': total_decisions
+    }
 
 
 def demo_comparison_oracle_accuracy(
     reaper_project_path: Path,
     target_frequency: float = 440.0,
     noise_levels: list = None,
-    n_comparisons: int = 50
+    n_comparisons: int = 50,
+    n_workers: Optional[int] = None
 ) -> Dict[str, Any]:
     """Demonstrate oracle accuracy at different noise levels.
 
@@ -244,6 +451,8 @@ def demo_comparison_oracle_accuracy(
         target_frequency: Target frequency for comparisons
         noise_levels: List of noise levels to test
         n_comparisons: Number of comparisons per noise level
+        n_workers: Processes for the noise-level sweep (None = one per core,
+            capped at the number of levels; 1 = serial with a shared oracle)
 
     Returns:
         Dictionary with accuracy results
@@ -251,65 +460,55 @@ def demo_comparison_oracle_accuracy(
     if noise_levels is None:
         noise_levels = [0.0, 0.05, 0.1, 0.2, 0.5]
 
-    print("=== Audio Oracle Accuracy Demo ===")
-    print(f"Target frequency: {target_frequency} Hz")
-    print(f"Noise levels: {noise_levels}")
-    print(f"Comparisons per level: {n_comparisons}")
-
-    results = {}
-
-    for noise_level in noise_levels:
-        print(f"\nTesting noise level: {noise_level}")
+    logger.info(
+        "=== Audio Oracle Accuracy Demo ===\n"
+        f"Target frequency: {target_frequency} Hz\n"
+        f"Noise levels: {noise_levels}\n"
+        f"Comparisons per level: {n_comparisons}"
+    )
 
+    # Create synthetic test data
+    # Generate frequencies at different distances from target
+    test_frequencies = [
+        target_frequency * (1 + 0.1 * i) for i in range(-5, 6)
+    ]
+
+    if n_workers is None:
+        n_workers = min(len(noise_levels), os.cpu_count() or 1)
+
+    if n_workers > 1:
+        # Noise levels are independent, so each one runs in its own worker
+        with ProcessPoolExecutor(max_workers=n_workers) as executor:
+            per_level = list(executor.map(
+                _eval_one_noise,
+                noise_levels,
+                repeat(target_frequency),
+                repeat(test_frequencies),
+                repeat(n_comparisons),
+                repeat(42)
+            ))
+    else:
+        # One oracle for every level: only the noise mixed into each decision
+        # changes, so analysis cached at one level is reused by the next
         oracle = AudioComparisonOracle(
             target_frequency=target_frequency,
-            noise_level=noise_level,
+            noise_level=0.0,
             random_seed=42
         )
-
-        # Create synthetic test data
-        # Generate frequencies at different distances from target
-        test_frequencies = [
-            target_frequency * (1 + 0.1 * i) for i in range(-5, 6)
+        per_level = [
+            _eval_one_noise(
+                noise_level, target_frequency, test_frequencies, n_comparisons, 42,
+                oracle=oracle
+            )
+            for noise_level in noise_levels
         ]
 
-        correct_decisions = 0
-        total_decisions = 0
-
-        # Test all pairwise comparisons
-        for i, freq_a in enumerate(test_frequencies):
-            for j, freq_b in enumerate(test_frequencies):
-                if i != j:
-                    # Create mock audio data (just frequency values for testing)
-                    # In real usage, these would be audio file paths
-
-                    # Ground truth: freq closer to target should win
-                    dist_a = abs(freq_a - target_frequency)
-                    dist_b = abs(freq_b - target_frequency)
-                    expected_a_wins = dist_a < dist_b
-
-                    # Oracle decision (using frequency as mock audio)
-                    oracle_decision = oracle.compare(freq_a, freq_b)
-
-                    if oracle_decision == expected_a_wins:
-                        correct_decisions += 1
-
-                    total_decisions += 1
-
-                    if total_decisions >= n_comparisons:
-                        break
-
-            if total_decisions >= n_comparisons:
-                break
-
-        accuracy = correct_decisions / total_decisions if total_decisions > 0 else 0.0
-        results[noise_level] = {
-            'accuracy': accuracy,
-            'correct_decisions': correct_decisions,
-            'total_decisions': total_decisions
-        }
-
-        print(f"Accuracy: {accuracy:.3f} ({correct_decisions}/{total_decisions})")
+    results = dict(zip(noise_levels, per_level))
+    for noise_level, level_result in results.items():
+        logger.info(
+            f"Noise level {noise_level}: accuracy {level_result['accuracy']:.3f} "
+            f"({level_result['correct_decisions']}/{level_result['total_decisions']})"
+        )
 
     return {
         'target_frequency': target_frequency,
@@ -327,17 +526,13 @@ def run_full_demo_suite(reaper_project_path: Path) -> Dict[str, Any]:
     Returns:
         Dictionary with all demo results
     """
-    print("="*80)
-    print("GA + JSI + AUDIO ORACLE INTEGRATION - FULL DEMO SUITE")
-    print("="*80)
+    logger.info("=" * 80 + "\nGA + JSI + AUDIO ORACLE INTEGRATION - FULL DEMO SUITE\n" + "=" * 80)
 
     all_results = {}
 
     try:
         # Demo 1: Basic JSI optimization
-        print("\n" + "="*50)
-        print("DEMO 1: Basic JSI Audio Optimization")
-        print("="*50)
+        logger.info("=" * 50 + "\nDEMO 1: Basic JSI Audio Optimization\n" + "=" * 50)
 
         basic_result = demo_jsi_audio_optimization(
             reaper_project_path=reaper_project_path,
@@ -350,9 +545,7 @@ def run_full_demo_suite(reaper_project_path: Path) -> Dict[str, Any]:
         all_results['basic_optimization'] = basic_result
 
         # Demo 2: Multi-target optimization
-        print("\n" + "="*50)
-        print("DEMO 2: Multi-Target Optimization")
-        print("="*50)
+        logger.info("=" * 50 + "\nDEMO 2: Multi-Target Optimization\n" + "=" * 50)
 
         multi_result = demo_multi_target_optimization(
             reaper_project_path=reaper_project_path,
@@ -364,9 +557,7 @@ def run_full_demo_suite(reaper_project_path: Path) -> Dict[str, Any]:
         all_results['multi_target'] = multi_result
 
         # Demo 3: Oracle accuracy analysis
-        print("\n" + "="*50)
-        print("DEMO 3: Oracle Accuracy Analysis")
-        print("="*50)
+        logger.info("=" * 50 + "\nDEMO 3: Oracle Accuracy Analysis\n" + "=" * 50)
 
         accuracy_result = demo_comparison_oracle_accuracy(
             reaper_project_path=reaper_project_path,
@@ -376,9 +567,7 @@ def run_full_demo_suite(reaper_project_path: Path) -> Dict[str, Any]:
         )
         all_results['oracle_accuracy'] = accuracy_result
 
-        print("\n" + "="*80)
-        print("FULL DEMO SUITE COMPLETED SUCCESSFULLY")
-        print("="*80)
+        logger.info("=" * 80 + "\nFULL DEMO SUITE COMPLETED SUCCESSFULLY\n" + "=" * 80)
 
         return {
             'success': True,
@@ -387,9 +576,7 @@ def run_full_demo_suite(reaper_project_path: Path) -> Dict[str, Any]:
         }
 
     except Exception as e:
-        print(f"\nDemo suite failed: {e}")
-        import traceback
-        traceback.print_exc()
+        logger.exception(f"Demo suite failed: {e}")
 
         return {
             'success': False,
@@ -0,0 +1,23 @@
+"""Shared pygame mixer setup for the human comparison oracles."""
+
+import pygame
+
+# 256-sample buffer at 44.1 kHz, about 6 ms from Play click to sound.
+# pre_init must run before any mixer init, or pygame's defaults apply
+pygame.mixer.pre_init(frequency=44100, size=-16, channels=2, buffer=256)
+
+_mixer_ready = False
+
+
+def ensure_mixer() -> None:
+    """Initialize the pygame mixer once per process.
+
+    Both oracles call this, and an oracle wrapping another does not probe
+    the audio device a second time.
+    """
+    global _mixer_ready
+    if _mixer_ready:
+        return
+    if not pygame.mixer.get_init():
+        pygame.mixer.init()
+    _mixer_ready = True
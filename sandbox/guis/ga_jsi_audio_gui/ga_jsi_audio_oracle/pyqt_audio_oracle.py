@@ -1,22 +1,23 @@
 """PyQt5-based human audio comparison oracle."""
 
-import sys
-import pygame
+import logging
 from pathlib import Path
 from typing import Any
 
 try:
     from PyQt5.QtWidgets import (QApplication, QMainWindow, QWidget, QVBoxLayout,
                                 QHBoxLayout, QPushButton, QLabel, QFrame, QMessageBox)
-    from PyQt5.QtCore import Qt, QTimer
+    from PyQt5.QtCore import Qt, QTimer, QEventLoop, QUrl
     from PyQt5.QtGui import QFont
+    from PyQt5.QtMultimedia import QSoundEffect
     PYQT_AVAILABLE = True
 except ImportError:
     PYQT_AVAILABLE = False
 
-sys.path.append(str(Path(__file__).parent.parent.parent / "choix_active_online"))
 from choix_active_online_demo.comparison_oracle import ComparisonOracle
 
+logger = logging.getLogger(__name__)
+
 
 class PyQtAudioComparisonOracle(ComparisonOracle):
     """PyQt5-based human audio comparison oracle."""
@@ -32,9 +33,7 @@ class PyQtAudioComparisonOracle(ComparisonOracle):
         self._result = None
         self._app = None
         self._window = None
-        
-        # Initialize pygame mixer for audio playback
-        pygame.mixer.init(frequency=44100, size=-16, channels=2, buffer=512)
+        self._loop = None
         
         if not PYQT_AVAILABLE:
             raise ImportError("PyQt5 is not available")
@@ -51,25 +50,26 @@ class PyQtAudioComparisonOracle(ComparisonOracle):
         """
         self.comparison_count += 1
 
-        # Convert to Path objects if needed
-        path_a = Path(item_a) if not isinstance(item_a, Path) else item_a
-        path_b = Path(item_b) if not isinstance(item_b, Path) else item_b
+        # Accept str or Path; Path() of a Path is a cheap copy
+        path_a = Path(item_a)
+        path_b = Path(item_b)
 
         # Validate files exist
         if not path_a.exists():
-            print(f"Warning: Audio file A not found: {path_a}")
+            logger.warning("Audio file A not found: %s", path_a)
             return False
         if not path_b.exists():
-            print(f"Warning: Audio file B not found: {path_b}")
+            logger.warning("Audio file B not found: %s", path_b)
             return True
 
-        print(f"\n=== Audio Comparison #{self.comparison_count} ===")
-        print(f"Option A: {path_a.name}")
-        print(f"Option B: {path_b.name}")
+        logger.info(
+            "\n=== Audio Comparison #%d ===\nOption A: %s\nOption B: %s",
+            self.comparison_count, path_a.name, path_b.name
+        )
 
                 # Create and run the comparison GUI
         return self._run_comparison_gui(path_a, path_b)
-    
+
     def _run_comparison_gui(self, path_a: Path, path_b: Path) -> bool:
         """Run the PyQt GUI for audio comparison.
         
@@ -82,34 +82,35 @@ class PyQtAudioComparisonOracle(ComparisonOracle):
         """
         self._result = None
         
-        # Create QApplication if it doesn't exist
-        if not QApplication.instance():
-            self._app = QApplication([])  # Use empty list instead of sys.argv
-        else:
+        # Create QApplication if it doesn't exist, and hold on to it for the
+        # oracle's lifetime: dropping the last reference tears down the app
+        # and with it the window reused below
+        if self._app is None:
             self._app = QApplication.instance()
+            if self._app is None:
+                self._app = QApplication([])  # Use empty list instead of sys.argv
         
-        # Create the main window
-        self._window = AudioComparisonWindow(path_a, path_b, self.comparison_count)
-        self._window.choice_made.connect(self._on_choice_made)
+        # One window serves every comparison; later ones only swap its
+        # labels and paths instead of rebuilding and restyling the widgets
+        if self._window is None:
+            self._window = AudioComparisonWindow(path_a, path_b, self.comparison_count)
+            self._window.choice_made.connect(self._on_choice_made)
+            self._window.destroyed.connect(self._on_window_destroyed)
+        else:
+            self._window.update_paths(path_a, path_b, self.comparison_count)
         self._window.show()
         
-        # Run the event loop until choice is made
-        while self._result is None:
-            self._app.processEvents()
-            if not self._window.isVisible():
-                # Window was closed without choice
-                self._result = True  # Default to A
-                break
-        
-        # Clean up
-        if self._window:
-            self._window.close()
-            self._window.deleteLater()
-            self._window = None
-        
-        # Don't store the app reference to avoid pickle issues
-        self._app = None
+        # Block in a nested Qt event loop until a choice is made; it sleeps
+        # between events instead of spinning on processEvents()
+        self._loop = QEventLoop()
+        self._loop.exec_()
+        self._loop = None
+        if self._result is None:
+            # Window was closed without choice
+            self._result = True  # Default to A
         
+        # The window (hidden) and app are kept for the next comparison;
+        # __getstate__ leaves both out when the oracle is pickled
         return self._result
 
     def _on_choice_made(self, chose_a: bool):
@@ -118,9 +119,28 @@ class PyQtAudioComparisonOracle(ComparisonOracle):
         Args:
             chose_a: True if user chose A, False if chose B
         """
+        if self._result is not None:
+            # Only the first choice of a comparison counts
+            return
         self._result = chose_a
         choice_label = "A" if chose_a else "B"
-        print(f"User selected: Option {choice_label}")
+        logger.info("User selected: Option %s", choice_label)
+        if self._loop is not None:
+            self._loop.quit()
+
+    def _on_window_destroyed(self):
+        """Forget the comparison window once Qt has deleted it."""
+        self._window = None
+        if self._loop is not None:
+            self._loop.quit()
+
+    def __getstate__(self):
+        """Drop the Qt objects, which cannot be pickled."""
+        state = self.__dict__.copy()
+        state['_app'] = None
+        state['_window'] = None
+        state['_loop'] = None
+        return state
 
     def get_comparison_count(self) -> int:
         """Get the number of comparisons made.
@@ -153,7 +173,53 @@ class AudioComparisonWindow(QMainWindow):
         self.path_a = path_a
         self.path_b = path_b
         self.comparison_num = comparison_num
+        # One Qt sound effect per side, pointed at each new pair of files
+        self._players = {'a': QSoundEffect(self), 'b': QSoundEffect(self)}
+        self._play_buttons = {}
         self._setup_ui()
+        for which, player in self._players.items():
+            player.statusChanged.connect(lambda which=which: self._sync_play_button(which))
+        self._load_sounds()
+
+    def update_paths(self, path_a: Path, path_b: Path, comparison_num: int):
+        """Point the window at a new pair of audio files.
+
+        Only the label texts change, so the widget tree and stylesheet are
+        reused as they are.
+
+        Args:
+            path_a: Path to first audio file
+            path_b: Path to second audio file
+            comparison_num: Comparison number for display
+        """
+        self.path_a = path_a
+        self.path_b = path_b
+        self.comparison_num = comparison_num
+        self.title_label.setText(f"Audio Comparison #{comparison_num}")
+        self.a_filename.setText(path_a.name)
+        self.b_filename.setText(path_b.name)
+        self._load_sounds()
+
+    def _load_sounds(self):
+        """Point both sound effects at the current pair of files.
+
+        Qt decodes a WAV off the GUI thread as soon as its source is set.
+        Each Play button stays disabled until its side has loaded, so the
+        window never blocks on disk and B can load while A is playing.
+        """
+        for which, path in (('a', self.path_a), ('b', self.path_b)):
+            self._players[which].setSource(QUrl.fromLocalFile(str(path)))
+            # Re-setting an unchanged source emits no statusChanged
+            self._sync_play_button(which)
+
+    def _sync_play_button(self, which: str):
+        """Enable a Play button once its sound has loaded (or failed to).
+
+        Args:
+            which: 'a' or 'b'
+        """
+        status = self._players[which].status()
+        self._play_buttons[which].setEnabled(status in (QSoundEffect.Ready, QSoundEffect.Error))
 
     def _setup_ui(self):
         """Set up the user interface."""
@@ -191,13 +257,13 @@ class AudioComparisonWindow(QMainWindow):
         main_layout.setContentsMargins(30, 30, 30, 30)
 
         # Title
-        title_label = QLabel(f"Audio Comparison #{self.comparison_num}")
-        title_label.setAlignment(Qt.AlignCenter)
+        self.title_label = QLabel(f"Audio Comparison #{self.comparison_num}")
+        self.title_label.setAlignment(Qt.AlignCenter)
         title_font = QFont()
         title_font.setPointSize(18)
         title_font.setBold(True)
-        title_label.setFont(title_font)
-        main_layout.addWidget(title_label)
+        self.title_label.setFont(title_font)
+        main_layout.addWidget(self.title_label)
 
         # Instructions
         instructions = QLabel("Listen to both audio samples and choose which one you prefer:")
@@ -223,13 +289,14 @@ class AudioComparisonWindow(QMainWindow):
         a_title.setFont(a_title_font)
         a_layout.addWidget(a_title)
 
-        a_filename = QLabel(self.path_a.name)
-        a_filename.setAlignment(Qt.AlignCenter)
-        a_filename.setWordWrap(True)
-        a_layout.addWidget(a_filename)
+        self.a_filename = QLabel(self.path_a.name)
+        self.a_filename.setAlignment(Qt.AlignCenter)
+        self.a_filename.setWordWrap(True)
+        a_layout.addWidget(self.a_filename)
 
         a_play_btn = QPushButton("▶ Play A")
-        a_play_btn.clicked.connect(lambda: self._play_audio(self.path_a))
+        a_play_btn.clicked.connect(lambda: self._play_audio('a'))
+        self._play_buttons['a'] = a_play_btn
         a_layout.addWidget(a_play_btn)
 
         a_choose_btn = QPushButton("Choose A")
@@ -253,13 +320,14 @@ class AudioComparisonWindow(QMainWindow):
         b_title.setFont(b_title_font)
         b_layout.addWidget(b_title)
 
-        b_filename = QLabel(self.path_b.name)
-        b_filename.setAlignment(Qt.AlignCenter)
-        b_filename.setWordWrap(True)
-        b_layout.addWidget(b_filename)
+        self.b_filename = QLabel(self.path_b.name)
+        self.b_filename.setAlignment(Qt.AlignCenter)
+        self.b_filename.setWordWrap(True)
+        b_layout.addWidget(self.b_filename)
 
         b_play_btn = QPushButton("▶ Play B")
-        b_play_btn.clicked.connect(lambda: self._play_audio(self.path_b))
+        b_play_btn.clicked.connect(lambda: self._play_audio('b'))
+        self._play_buttons['b'] = b_play_btn
         b_layout.addWidget(b_play_btn)
 
         b_choose_btn = QPushButton("Choose B")
@@ -277,36 +345,39 @@ class AudioComparisonWindow(QMainWindow):
         main_layout.addWidget(stop_btn)
 
     def _center_window(self):
-        """Center the window on screen."""
-        from PyQt5.QtWidgets import QDesktopWidget
-        screen = QDesktopWidget().screenGeometry()
+        """Center the window on the primary screen.
+
+        Runs once, when the reused window is built; the oracle keeps its
+        QApplication and window alive between comparisons, so the screen is
+        only queried once per session.
+        """
+        screen = QApplication.primaryScreen().geometry()
         size = self.geometry()
         x = (screen.width() - size.width()) // 2
         y = (screen.height() - size.height()) // 2
         self.move(x, y)
 
-    def _play_audio(self, audio_path: Path):
-        """Play an audio file using pygame.
+    def _play_audio(self, which: str):
+        """Play one of the two audio files.
 
         Args:
-            audio_path: Path to audio file to play
+            which: 'a' or 'b'
         """
-        try:
-            pygame.mixer.music.stop()
-            pygame.mixer.music.load(str(audio_path))
-            pygame.mixer.music.play()
-            print(f"Playing: {audio_path.name}")
-        except pygame.error as e:
-            print(f"Error playing audio {audio_path.name}: {e}")
-            QMessageBox.warning(self, "Audio Error", f"Could not play {audio_path.name}: {e}")
+        audio_path = self.path_a if which == 'a' else self.path_b
+        player = self._players[which]
+        if player.status() == QSoundEffect.Error:
+            logger.warning("Error playing audio %s", audio_path.name)
+            QMessageBox.warning(self, "Audio Error", f"Could not play {audio_path.name}")
+            return
+
+        self._stop_audio()
+        player.play()
+        logger.info("Playing: %s", audio_path.name)
 
     def _stop_audio(self):
         """Stop any currently playing audio."""
-        try:
-            pygame.mixer.music.stop()
-            print("Audio stopped")
-        except pygame.error as e:
-            print(f"Error stopping audio: {e}")
+        for player in self._players.values():
+            player.stop()
 
     def _make_choice(self, chose_a: bool):
         """Handle user's choice.
@@ -316,7 +387,8 @@ class AudioComparisonWindow(QMainWindow):
         """
         self._stop_audio()
         self.choice_made.emit(chose_a)
-        self.close()
+        # Hide rather than close: the window is reused for the next comparison
+        self.hide()
 
     def closeEvent(self, event):
         """Handle window close event."""
@@ -1,12 +1,15 @@
 """Entry point for GA + JSI + Human Audio Oracle integration demo."""
 
+import logging
 from pathlib import Path
-from ga_jsi_audio_oracle.main import demo_jsi_audio_optimization
+from ga_jsi_audio_oracle.main import demo_jsi_audio_optimization, GenerationLogCallback
 from ga_jsi_audio_oracle.human_audio_oracle import HumanAudioComparisonOracle
 
 
 def main():
     """Run the GA + JSI + Human Audio Oracle demo."""
+    # Unbuffered: oracle messages must show up while the user is choosing
+    logging.basicConfig(level=logging.INFO, format="%(message)s")
     print("GA + JSI + Human Audio Oracle Integration Demo")
     print("=" * 50)
     print("This demo uses HUMAN selection instead of automated frequency analysis!")
@@ -127,6 +130,10 @@ def demo_jsi_human_audio_optimization(
     # Set termination criteria
     termination = get_termination("n_gen", n_generations)
 
+    # Record (generation, best F) only; save_history would deep-copy the
+    # algorithm, problem and oracle every generation
+    callback = GenerationLogCallback(record_history=True)
+
     print(f"\nStarting human-guided optimization...")
     start_time = time.time()
 
@@ -136,8 +143,9 @@ def demo_jsi_human_audio_optimization(
             problem=problem,
             algorithm=algorithm,
             termination=termination,
-            verbose=True,
-            save_history=True
+            callback=callback,
+            verbose=False,
+            save_history=False
         )
 
         end_time = time.time()
@@ -148,6 +156,11 @@ def demo_jsi_human_audio_optimization(
         # Extract best solution information
         best_info = problem.get_best_solution_info(result)
 
+        # Drop the result's references to the problem so the oracle and its
+        # audio caches can be collected once the caller is done with it
+        result.problem = None
+        result.algorithm = None
+
         # Compile results
         results = {
             'success': True,
@@ -158,6 +171,7 @@ def demo_jsi_human_audio_optimization(
             'total_evaluations': problem.evaluation_count,
             'population_size': population_size,
             'human_comparisons': oracle.get_comparison_count(),
+            'history': callback.history,
             'result': result
         }
 
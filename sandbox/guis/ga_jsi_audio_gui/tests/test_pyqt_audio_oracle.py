@@ -0,0 +1,52 @@
+"""Tests for the PyQt human audio comparison oracle."""
+
+import os
+
+import pytest
+from unittest.mock import patch
+
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+pytest.importorskip("PyQt5.QtMultimedia")
+
+from ga_jsi_audio_oracle.pyqt_audio_oracle import AudioComparisonWindow, PyQtAudioComparisonOracle
+
+
+class TestPyQtAudioComparisonOracle:
+    """Test suite for PyQtAudioComparisonOracle."""
+
+    def test_window_reused_across_comparisons(self, tmp_path):
+        """Test that the app and window survive from one comparison to the next."""
+        path_a = tmp_path / 'a.wav'
+        path_b = tmp_path / 'b.wav'
+        path_a.touch()
+        path_b.touch()
+        oracle = PyQtAudioComparisonOracle()
+
+        with patch('ga_jsi_audio_oracle.pyqt_audio_oracle.QEventLoop') as loop_cls:
+            # Stand in for the user: the nested event loop returns with a choice
+            loop_cls.return_value.exec_.side_effect = lambda: oracle._window._make_choice(True)
+            assert oracle.compare(path_a, path_b) is True
+            window = oracle._window
+            app = oracle._app
+
+            assert oracle.compare(path_b, path_a) is True
+
+        assert oracle._window is window
+        assert oracle._app is app
+        assert window.comparison_num == 2
+
+    def test_window_centered_once(self, tmp_path):
+        """Test that the screen is queried only when the reused window is built."""
+        path_a = tmp_path / 'a.wav'
+        path_b = tmp_path / 'b.wav'
+        path_a.touch()
+        path_b.touch()
+        oracle = PyQtAudioComparisonOracle()
+
+        with patch('ga_jsi_audio_oracle.pyqt_audio_oracle.QEventLoop') as loop_cls, \
+                patch.object(AudioComparisonWindow, '_center_window') as center:
+            loop_cls.return_value.exec_.side_effect = lambda: oracle._window._make_choice(False)
+            for _ in range(3):
+                assert oracle.compare(path_a, path_b) is False
+
+        assert center.call_count == 1
@@ -6,27 +6,31 @@ import pytest
 from fastapi.testclient import TestClient
 from backend.main import app
 
-client = TestClient(app)
+@pytest.fixture(scope="module")
+def client():
+    """One client for the whole module; startup and shutdown run once."""
+    with TestClient(app) as test_client:
+        yield test_client
 
-def test_root_endpoint():
+def test_root_endpoint(client):
     """Test the root health check endpoint."""
     response = client.get("/")
     assert response.status_code == 200
     assert "Audio Comparison API operational" in response.json()["message"]
 
-def test_get_audio_files():
+def test_get_audio_files(client):
     """Test retrieving all audio files."""
     response = client.get("/api/audio-files")
     assert response.status_code == 200
     assert isinstance(response.json(), list)
 
-def test_get_next_comparison():
+def test_get_next_comparison(client):
     """Test retrieving next comparison pair."""
     response = client.get("/api/comparisons/next")
     assert response.status_code == 200
     # Should return a comparison pair or null
 
-def test_get_stats():
+def test_get_stats(client):
     """Test retrieving comparison statistics."""
     response = client.get("/api/stats")
     assert response.status_code == 200
@@ -35,7 +39,7 @@ def test_get_stats():
     assert "completed_comparisons" in data
     assert "preference_distribution" in data
 
-def test_submit_preference():
+def test_submit_preference(client):
     """Test submitting a preference for a comparison."""
     # First get a comparison
     comparison_response = client.get("/api/comparisons/next")
@@ -57,7 +61,7 @@ def test_submit_preference():
     assert response.status_code == 200
     assert "successfully" in response.json()["message"]
 
-def test_invalid_preference():
+def test_invalid_preference(client):
     """Test submitting invalid preference data."""
     # Get a comparison first
     comparison_response = client.get("/api/comparisons/next")
@@ -71,6 +71,28 @@ class TestSimulatedOracle:
         result = oracle.compare("A", "Unknown")
         assert isinstance(result, bool)
 
+    def test_compare_batch_matches_sequential(self):
+        """Test batched comparisons draw the same outcomes as single ones."""
+        strengths = {"A": 2.0, "B": 1.0, "C": 0.5}
+        items_a = ["A", "B", "C", "A", "Unknown"] * 4
+        items_b = ["B", "C", "A", "C", "A"] * 4
+
+        oracle1 = SimulatedOracle(strengths, noise_level=0.2, random_seed=7)
+        oracle2 = SimulatedOracle(strengths, noise_level=0.2, random_seed=7)
+
+        sequential = [oracle1.compare(a, b) for a, b in zip(items_a, items_b)]
+        batch = oracle2.compare_batch(items_a, items_b)
+
+        assert batch.dtype == bool
+        assert batch.tolist() == sequential
+
+    def test_compare_batch_length_mismatch(self):
+        """Test batched comparisons reject unequal pair lists."""
+        oracle = SimulatedOracle({"A": 1.0}, random_seed=42)
+
+        with pytest.raises(ValueError):
+            oracle.compare_batch(["A", "A"], ["A"])
+
 
 class TestHumanOracle:
     """Test cases for HumanOracle."""
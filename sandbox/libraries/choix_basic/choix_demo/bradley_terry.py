@@ -2,7 +2,7 @@
 
 import numpy as np
 import pandas as pd
-from typing import List, Tuple, Dict, Any
+from typing import List, Tuple, Dict, Any, Optional
 import choix
 
 
@@ -130,12 +130,10 @@ class BradleyTerryDemo:
         true_ranking = rankings['true_ranking']
         estimated_ranking = rankings['estimated_ranking']
 
-        # Kendall's tau (rank correlation)
+        # Kendall's tau (rank correlation); it depends only on the order of
+        # the strengths, so they are passed directly instead of rank positions
         from scipy.stats import kendalltau
-        tau, p_value = kendalltau(
-            [true_ranking.index(item) for item in self.item_names],
-            [estimated_ranking.index(item) for item in self.item_names]
-        )
+        tau, p_value = kendalltau(self.true_strengths, self.estimated_strengths)
 
         # Top-k accuracy (how many of top k items are correctly identified)
         top_k_accuracies = {}
@@ -151,17 +149,23 @@ class BradleyTerryDemo:
             **top_k_accuracies
         }
 
-    def run_full_demo(self, n_comparisons: int = 100) -> Dict[str, Any]:
+    def run_full_demo(self, n_comparisons: int = 100,
+                      comparisons: Optional[List[Tuple[int, int, int]]] = None) -> Dict[str, Any]:
         """Run the complete Bradley-Terry demonstration.
 
         Args:
             n_comparisons: Number of comparisons to simulate
+            comparisons: Previously generated comparisons to fit on instead of
+                simulating new ones; the first n_comparisons are used
 
         Returns:
             Complete results dictionary
         """
-        # Generate data and fit model
-        self.generate_comparison_data(n_comparisons)
+        # Generate data (or reuse the given data) and fit model
+        if comparisons is None:
+            self.generate_comparison_data(n_comparisons)
+        else:
+            self.comparisons = list(comparisons[:n_comparisons])
         self.fit_bradley_terry_model()
 
         # Gather results
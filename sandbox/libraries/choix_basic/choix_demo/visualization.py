@@ -1,5 +1,6 @@
 """Visualization utilities for Bradley-Terry demonstration."""
 
+import warnings
 import matplotlib.pyplot as plt
 import numpy as np
 import pandas as pd
@@ -36,9 +37,9 @@ class BradleyTerryVisualizer:
         width = 0.35
 
         ax1.bar(x - width/2, rankings['true_strengths'], width,
-                label='True Strengths', alpha=0.8, color='blue')
+                label='True Strengths', alpha=0.8, color='blue', rasterized=True)
         ax1.bar(x + width/2, rankings['estimated_strengths'], width,
-                label='Estimated Strengths', alpha=0.8, color='red')
+                label='Estimated Strengths', alpha=0.8, color='red', rasterized=True)
 
         ax1.set_xlabel('Items (ranked by true strength)')
         ax1.set_ylabel('Strength')
@@ -50,7 +51,7 @@ class BradleyTerryVisualizer:
 
         # Plot 2: Scatter plot
         ax2.scatter(rankings['true_strengths'], rankings['estimated_strengths'],
-                   alpha=0.7, s=100)
+                   alpha=0.7, s=100, rasterized=True)
 
         # Add diagonal line for perfect correlation
         min_val = min(min(rankings['true_strengths']), min(rankings['estimated_strengths']))
@@ -72,8 +73,9 @@ class BradleyTerryVisualizer:
         plt.tight_layout()
 
         if save_path:
-            plt.savefig(save_path, dpi=300, bbox_inches='tight')
+            fig.savefig(save_path, dpi=300, bbox_inches='tight')
         plt.show()
+        plt.close(fig)
 
     def plot_comparison_matrix(self, results: Dict[str, Any],
                               save_path: Optional[str] = None) -> None:
@@ -85,19 +87,20 @@ class BradleyTerryVisualizer:
         """
         comparison_matrix = results['comparison_matrix']
 
-        plt.figure(figsize=self.figsize)
+        fig = plt.figure(figsize=self.figsize)
 
-        # Create heatmap
+        # Create heatmap; the cell mesh is rasterized in vector output
         sns.heatmap(comparison_matrix, annot=True, fmt='d', cmap='Blues',
-                   cbar_kws={'label': 'Number of Wins'})
+                   cbar_kws={'label': 'Number of Wins'}, rasterized=True)
 
         plt.title('Pairwise Comparison Matrix\n(Rows beat Columns)')
         plt.xlabel('Loser')
         plt.ylabel('Winner')
 
         if save_path:
-            plt.savefig(save_path, dpi=300, bbox_inches='tight')
+            fig.savefig(save_path, dpi=300, bbox_inches='tight')
         plt.show()
+        plt.close(fig)
 
     def plot_ranking_comparison(self, results: Dict[str, Any],
                                save_path: Optional[str] = None) -> None:
@@ -115,7 +118,8 @@ class BradleyTerryVisualizer:
         # Plot 1: Ranking comparison
         items = rankings['true_ranking']
         true_positions = list(range(1, len(items) + 1))
-        estimated_positions = [rankings['estimated_ranking'].index(item) + 1 for item in items]
+        estimated_position = {item: i + 1 for i, item in enumerate(rankings['estimated_ranking'])}
+        estimated_positions = [estimated_position[item] for item in items]
 
         ax1.plot(true_positions, estimated_positions, 'bo-', markersize=8, linewidth=2)
         ax1.plot([1, len(items)], [1, len(items)], 'k--', alpha=0.5,
@@ -139,7 +143,7 @@ class BradleyTerryVisualizer:
         k_values = [int(k.split('_')[1]) for k in top_k_keys]
         accuracies = [accuracy_metrics[k] for k in top_k_keys]
 
-        ax2.bar(k_values, accuracies, alpha=0.7, color='green')
+        ax2.bar(k_values, accuracies, alpha=0.7, color='green', rasterized=True)
         ax2.set_xlabel('Top-k')
         ax2.set_ylabel('Accuracy')
         ax2.set_title('Top-k Ranking Accuracy')
@@ -153,8 +157,9 @@ class BradleyTerryVisualizer:
         plt.tight_layout()
 
         if save_path:
-            plt.savefig(save_path, dpi=300, bbox_inches='tight')
+            fig.savefig(save_path, dpi=300, bbox_inches='tight')
         plt.show()
+        plt.close(fig)
 
     def plot_convergence_analysis(self, demo, comparison_counts: list = None,
                                  save_path: Optional[str] = None) -> None:
@@ -171,16 +176,32 @@ class BradleyTerryVisualizer:
         kendall_taus = []
         top_1_accuracies = []
 
+        # Simulate the largest sample once and fit on its prefixes, so each
+        # point extends the same data instead of drawing a fresh sample
+        all_comparisons = demo.generate_comparison_data(max(comparison_counts))
+
+        # Fewer comparisons than this cannot connect every item, so the
+        # model cannot be fitted and the point is scored as a random guess
+        min_required = demo.n_items - 1
+
         for n_comp in comparison_counts:
+            if n_comp < min_required:
+                kendall_taus.append(0.0)
+                top_1_accuracies.append(1.0 / demo.n_items)
+                continue
+
             try:
-                results = demo.run_full_demo(n_comp)
-                metrics = results['accuracy_metrics']
-                kendall_taus.append(metrics['kendall_tau'])
-                top_1_accuracies.append(metrics['top_1_accuracy'])
-            except ValueError:
-                # Model failed to converge with insufficient data
+                results = demo.run_full_demo(n_comp, comparisons=all_comparisons)
+            except (ValueError, RuntimeError) as e:
+                # Enough comparisons, but too unevenly spread for the fit
+                warnings.warn(f"Bradley-Terry fit failed with {n_comp} comparisons: {e}")
                 kendall_taus.append(0.0)
-                top_1_accuracies.append(1.0 / demo.n_items)  # Random guess
+                top_1_accuracies.append(1.0 / demo.n_items)
+                continue
+
+            metrics = results['accuracy_metrics']
+            kendall_taus.append(metrics['kendall_tau'])
+            top_1_accuracies.append(metrics['top_1_accuracy'])
 
         fig, (ax1, ax2) = plt.subplots(1, 2, figsize=self.figsize)
 
@@ -203,8 +224,9 @@ class BradleyTerryVisualizer:
         plt.tight_layout()
 
         if save_path:
-            plt.savefig(save_path, dpi=300, bbox_inches='tight')
+            fig.savefig(save_path, dpi=300, bbox_inches='tight')
         plt.show()
+        plt.close(fig)
 
     def create_summary_report(self, results: Dict[str, Any]) -> str:
         """Create a text summary of the results.
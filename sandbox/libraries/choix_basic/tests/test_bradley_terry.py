@@ -123,6 +123,17 @@ class TestBradleyTerryDemo:
         assert results['n_items'] == 4
         assert results['n_comparisons'] == 100
 
+    def test_run_full_demo_with_given_comparisons(self):
+        """Test demo run on a prefix of existing comparisons."""
+        demo = BradleyTerryDemo(n_items=4, random_seed=42)
+        all_comparisons = demo.generate_comparison_data(100)
+
+        results = demo.run_full_demo(n_comparisons=40, comparisons=all_comparisons)
+
+        assert results['n_comparisons'] == 40
+        assert demo.comparisons == all_comparisons[:40]
+        assert results['comparison_matrix'].values.sum() == 40
+
     def test_reproducibility(self):
         """Test that results are reproducible with same random seed."""
         demo1 = BradleyTerryDemo(n_items=4, random_seed=42)
@@ -7,6 +7,7 @@ import numpy as np
 import tempfile
 import soundfile as sf
 from pathlib import Path
+from unittest.mock import patch
 from ga_frequency_demo.audio_analysis import (
     FrequencyDistanceCalculator, create_target_audio_generator
 )
@@ -39,9 +40,9 @@ def temp_audio_file(sample_audio):
 
     yield temp_path
 
-    # Cleanup
-    if temp_path.exists():
-        temp_path.unlink()
+    # Cleanup, including decoded-audio caches written next to the file
+    for path in temp_path.parent.glob(f'{temp_path.stem}.*'):
+        path.unlink()
 
 
 class TestFrequencyDistanceCalculator:
@@ -73,6 +74,27 @@ class TestFrequencyDistanceCalculator:
         with pytest.raises(FileNotFoundError):
             calc.load_audio(Path("nonexistent_file.wav"))
 
+    def test_load_audio_cached(self, sample_audio, tmp_path):
+        audio, sr = sample_audio
+        path = tmp_path / "tone.wav"
+        sf.write(path, audio, sr)
+        calc = FrequencyDistanceCalculator()
+
+        first = calc.load_audio(path)
+        cache_path = tmp_path / f"tone.{calc.sr}.f32.npy"
+        assert cache_path.exists()
+        assert not first.flags.writeable
+
+        # Same process reuses the decoded array
+        assert calc.load_audio(path) is first
+
+        # A fresh process would map the .npy instead of decoding again
+        with patch('ga_frequency_demo.audio_analysis._audio_cache', {}), \
+                patch('librosa.load') as decode:
+            mapped = calc.load_audio(path)
+        decode.assert_not_called()
+        np.testing.assert_array_equal(mapped, first)
+
     def test_compute_spectral_features(self, sample_audio):
         calc = FrequencyDistanceCalculator()
         audio, _ = sample_audio
@@ -89,6 +111,8 @@ class TestFrequencyDistanceCalculator:
             assert feature in features
             assert isinstance(features[feature], np.ndarray)
             assert features[feature].size > 0
+            # float64 input is analyzed in single precision
+            assert features[feature].dtype == np.float32
 
         # Check feature dimensions
         assert features['spectral_centroid'].ndim == 1
@@ -121,6 +145,15 @@ class TestFrequencyDistanceCalculator:
         assert distance > 0
         assert isinstance(distance, float)
 
+    def test_compute_frequency_distance_different_lengths(self, sample_audio):
+        calc = FrequencyDistanceCalculator()
+        audio, _ = sample_audio
+        half = len(audio) // 2
+
+        # The longer signal is compared over the shorter one's length only
+        distance = calc.compute_frequency_distance(audio, audio[:half])
+        assert distance == calc.compute_frequency_distance(audio[:half], audio[:half])
+
     def test_compute_frequency_distance_custom_weights(self, sample_audio):
         calc = FrequencyDistanceCalculator()
         audio1, sr = sample_audio
@@ -144,6 +177,25 @@ class TestFrequencyDistanceCalculator:
         assert distance > 0
         assert isinstance(distance, float)
 
+    def test_target_features_cached(self, sample_audio):
+        calc = FrequencyDistanceCalculator()
+        target, _ = sample_audio
+
+        t = np.linspace(0, 1.0, len(target), False)
+        candidates = [0.5 * np.sin(2 * np.pi * f * t) for f in (450.0, 500.0, 550.0)]
+
+        with patch.object(
+            calc, 'compute_spectral_features', wraps=calc.compute_spectral_features
+        ) as compute:
+            for candidate in candidates:
+                calc.compute_frequency_distance(target, candidate)
+
+        # Target analyzed once, each candidate once
+        assert compute.call_count == 1 + len(candidates)
+
+        calc.clear_cache()
+        assert len(calc._feature_cache) == 0
+
     def test_spectral_convergence(self, sample_audio):
         calc = FrequencyDistanceCalculator()
         audio, _ = sample_audio
@@ -180,8 +232,8 @@ class TestFrequencyDistanceCalculator:
             assert isinstance(distance, float)
 
         finally:
-            if temp_path2.exists():
-                temp_path2.unlink()
+            for path in temp_path2.parent.glob(f'{temp_path2.stem}.*'):
+                path.unlink()
 
     def test_analyze_fundamental_frequency(self, sample_audio):
         calc = FrequencyDistanceCalculator()
@@ -215,6 +267,18 @@ class TestTargetAudioGenerator:
         assert isinstance(target_audio, np.ndarray)
         assert len(target_audio) > 0
 
+    def test_create_target_audio_generator_cached(self, temp_audio_file):
+        first = create_target_audio_generator(temp_audio_file, 100.0)
+        second = create_target_audio_generator(temp_audio_file, 100.0)
+
+        # Same file and shift reuse the shifted audio, which is read-only
+        assert second is first
+        assert not first.flags.writeable
+
+        # A different shift is generated separately
+        other = create_target_audio_generator(temp_audio_file, 50.0)
+        assert other is not first
+
     def test_create_target_audio_generator_nonexistent_file(self):
         with pytest.raises(FileNotFoundError):
             create_target_audio_generator(Path("nonexistent.wav"), 0.0)
@@ -2,18 +2,49 @@
 Integration tests for the complete GA-REAPER system.
 """
 
+import json
 import pytest
 import tempfile
 import subprocess
 import numpy as np
+import soundfile as sf
 from pathlib import Path
 from unittest.mock import Mock, patch, MagicMock
 from ga_frequency_demo.genetics import Solution, PopulationGenerator, GenomeToPhenotypeMapper
 from ga_frequency_demo.config import SessionConfig
+from ga_frequency_demo import reaper_integration
+from ga_frequency_demo.audio_analysis import FrequencyDistanceCalculator
 from ga_frequency_demo.reaper_integration import ReaperExecutor, FitnessEvaluator, ReaperGAIntegration
 from ga_frequency_demo.ga_problem import FrequencyOptimizationProblem, TargetFrequencyProblem
 
 
+@pytest.fixture
+def write_tone(tmp_path):
+    """Write half-second sine tones into tmp_path"""
+    sr = 44100
+    t = np.linspace(0, 0.5, sr // 2, False)
+
+    def write(name, frequency):
+        path = tmp_path / name
+        sf.write(path, 0.5 * np.sin(2 * np.pi * frequency * t), sr)
+        return path
+
+    return write
+
+
+@pytest.fixture
+def target_path(write_tone):
+    """440 Hz target tone for fitness evaluation"""
+    return write_tone("target.wav", 440.0)
+
+
+class ConstantCalculator(FrequencyDistanceCalculator):
+    """Calculator subclass with its own distance, as a user might supply"""
+
+    def compute_frequency_distance(self, audio1, audio2, weights=None):
+        return 7.0
+
+
 class TestGenomeToPhenotypeIntegration:
     def test_solution_to_session_config_integration(self):
         """Test complete pipeline from solutions to session config"""
@@ -190,6 +221,130 @@ class TestFitnessEvaluatorMocked:
         assert fitness_values[0] == 1000.0  # No matching render
         assert fitness_values[1] == 1000.0  # No matching render
 
+    def test_evaluate_population_matches_renders_by_individual(self):
+        evaluator = FitnessEvaluator()
+        solutions = [Solution(0.0, 0.0), Solution(1.0, 0.5), Solution(-1.0, 0.0)]
+        render_paths = {
+            "gen_001_individual_002_1700000000": Path("c.wav"),
+            "gen_001_individual_000_1700000000": Path("a.wav"),
+        }
+
+        with patch.object(evaluator, 'evaluate_solution', return_value=1.0) as evaluate:
+            fitness_values = evaluator.evaluate_population(solutions, render_paths)
+
+        assert fitness_values == [1.0, 1000.0, 1.0]
+        assert [c.args for c in evaluate.call_args_list] == [
+            (solutions[0], Path("a.wav")),
+            (solutions[2], Path("c.wav")),
+        ]
+
+    def test_identical_renders_analyzed_once(self, write_tone, target_path):
+        render_paths = [write_tone(f"render_{i}.wav", 660.0) for i in range(2)]
+
+        evaluator = FitnessEvaluator(target_path)
+        calculator = evaluator.distance_calculator
+        with patch.object(
+            calculator, 'compute_frequency_distance',
+            wraps=calculator.compute_frequency_distance
+        ) as compute:
+            first = evaluator.evaluate_solution(Solution(0.5, 0.0), render_paths[0])
+            second = evaluator.evaluate_solution(Solution(0.5, 0.0), render_paths[1])
+
+        assert first == second
+        assert compute.call_count == 1
+
+    def test_distances_persist_in_cache_dir(self, tmp_path, write_tone, target_path):
+        render_path = write_tone("render.wav", 660.0)
+        cache_dir = tmp_path / "cache"
+
+        evaluator = FitnessEvaluator(target_path, cache_dir=cache_dir)
+        distance = evaluator.evaluate_solution(Solution(0.5, 0.0), render_path)
+        evaluator.save_distance_cache()
+        assert (cache_dir / "audio_distance_cache.json").exists()
+
+        # A new run reads the saved distance instead of analyzing the render
+        restarted = FitnessEvaluator(target_path, cache_dir=cache_dir)
+        with patch.object(restarted.distance_calculator, 'compute_frequency_distance') as compute:
+            assert restarted.evaluate_solution(Solution(0.5, 0.0), render_path) == distance
+        compute.assert_not_called()
+
+    def test_distance_cache_from_other_version_discarded(self, tmp_path, write_tone, target_path):
+        render_path = write_tone("render.wav", 660.0)
+        cache_dir = tmp_path / "cache"
+
+        evaluator = FitnessEvaluator(target_path, cache_dir=cache_dir)
+        evaluator.evaluate_solution(Solution(0.5, 0.0), render_path)
+        evaluator.save_distance_cache()
+
+        cache_path = cache_dir / "audio_distance_cache.json"
+        data = json.loads(cache_path.read_text())
+        data['version'] = reaper_integration._DISTANCE_CACHE_VERSION - 1
+        cache_path.write_text(json.dumps(data))
+
+        # Distances from another version of the analysis are not reused
+        restarted = FitnessEvaluator(target_path, cache_dir=cache_dir)
+        assert restarted._distance_cache == {}
+
+    def test_distance_cache_separates_calculator_types(self, tmp_path, write_tone, target_path):
+        render_path = write_tone("render.wav", 660.0)
+        cache_dir = tmp_path / "cache"
+
+        evaluator = FitnessEvaluator(target_path, cache_dir=cache_dir)
+        evaluator.evaluate_solution(Solution(0.5, 0.0), render_path)
+        evaluator.save_distance_cache()
+
+        custom = FitnessEvaluator(
+            target_path, distance_calculator=ConstantCalculator(), cache_dir=cache_dir
+        )
+        assert custom.evaluate_solution(Solution(0.5, 0.0), render_path) == 7.0
+
+    def test_population_analyzed_in_pool(self, write_tone, target_path):
+        render_paths = {
+            f"individual_{i:03d}": write_tone(f"individual_{i:03d}.wav", freq)
+            for i, freq in enumerate([330.0, 550.0, 660.0])
+        }
+        solutions = [Solution(0.0, 0.0)] * 3
+
+        serial = FitnessEvaluator(target_path, parallel=False)
+        expected = serial.evaluate_population(solutions, render_paths)
+
+        evaluator = FitnessEvaluator(target_path)
+        # The pool started here is shut down and the module's pool restored,
+        # so its two workers do not outlive the test
+        with patch('ga_frequency_demo.reaper_integration.os.cpu_count', return_value=2), \
+                patch('ga_frequency_demo.reaper_integration._POOL', None):
+            try:
+                evaluator._prefetch_distances(list(render_paths.values()))
+            finally:
+                if reaper_integration._POOL is not None:
+                    reaper_integration._POOL.shutdown()
+        assert len(evaluator._distance_cache) == 3
+
+        # Workers filled the memo, so no render is analyzed again here
+        with patch.object(evaluator.distance_calculator, 'compute_frequency_distance') as compute:
+            fitness_values = evaluator.evaluate_population(solutions, render_paths)
+        compute.assert_not_called()
+        np.testing.assert_allclose(fitness_values, expected, rtol=1e-6)
+
+    def test_worker_calculators_use_single_threaded_fft(self):
+        # One process per core already, so threaded FFTs would oversubscribe
+        assert reaper_integration._worker_calculator(22050, 1024, 256).fft_workers == 1
+        assert FrequencyDistanceCalculator().fft_workers == -1
+
+    def test_custom_calculator_not_replaced_by_pool(self, write_tone, target_path):
+        render_paths = {
+            f"individual_{i:03d}": write_tone(f"individual_{i:03d}.wav", freq)
+            for i, freq in enumerate([330.0, 550.0])
+        }
+
+        evaluator = FitnessEvaluator(target_path, distance_calculator=ConstantCalculator())
+        with patch('ga_frequency_demo.reaper_integration.os.cpu_count', return_value=2), \
+                patch('ga_frequency_demo.reaper_integration._get_pool') as get_pool:
+            fitness_values = evaluator.evaluate_population([Solution(0.0, 0.0)] * 2, render_paths)
+
+        get_pool.assert_not_called()
+        assert fitness_values == [7.0, 7.0]
+
 
 class TestGAProblemIntegration:
     @patch('ga_frequency_demo.reaper_integration.ReaperGAIntegration')
@@ -2,7 +2,7 @@
 
 from abc import ABC, abstractmethod
 import numpy as np
-from typing import Any, Optional
+from typing import Any, Optional, Sequence
 
 
 class ComparisonOracle(ABC):
@@ -21,6 +21,23 @@ class ComparisonOracle(ABC):
         """
         pass
 
+    def compare_batch(self, items_a: Sequence[Any], items_b: Sequence[Any]) -> np.ndarray:
+        """Compare many independent pairs of items.
+
+        The default asks compare() for each pair in turn; oracles that can
+        answer a batch at once (vectorized or in a single screen) override it.
+
+        Args:
+            items_a: First item of each pair
+            items_b: Second item of each pair
+
+        Returns:
+            Boolean array, True where items_a[i] is better than items_b[i]
+        """
+        if len(items_a) != len(items_b):
+            raise ValueError("items_a and items_b must have the same length")
+        return np.array([self.compare(a, b) for a, b in zip(items_a, items_b)], dtype=bool)
+
 
 class SimulatedOracle(ComparisonOracle):
     """Simulated oracle using ground truth with noise for demonstrations."""
@@ -60,6 +77,30 @@ class SimulatedOracle(ComparisonOracle):
         # Make stochastic decision
         return self.rng.random() < noisy_prob
 
+    def compare_batch(self, items_a: Sequence[Any], items_b: Sequence[Any]) -> np.ndarray:
+        """Compare many pairs with one vectorized draw.
+
+        Draws the same random numbers as calling compare() on each pair in
+        turn, so results do not depend on how comparisons are batched.
+
+        Args:
+            items_a: First item of each pair
+            items_b: Second item of each pair
+
+        Returns:
+            Boolean array, True where items_a[i] is better than items_b[i]
+        """
+        if len(items_a) != len(items_b):
+            raise ValueError("items_a and items_b must have the same length")
+
+        strength_a = np.array([self.item_strengths.get(item, 1.0) for item in items_a], dtype=float)
+        strength_b = np.array([self.item_strengths.get(item, 1.0) for item in items_b], dtype=float)
+
+        prob_a_wins = strength_a / (strength_a + strength_b)
+        noisy_prob = (1 - self.noise_level) * prob_a_wins + self.noise_level * 0.5
+
+        return self.rng.random(len(items_a)) < noisy_prob
+
 
 class HumanOracle(ComparisonOracle):
     """Human oracle that prompts user via callback for comparisons."""
@@ -42,9 +42,11 @@ class JSIAdaptiveQuicksort:
         less = []
         greater = []
 
-        for item in rest:
-            # Make comparison
-            if self.oracle.compare(item, pivot):
+        # Every item is compared with the same pivot, so ask for them at once
+        results = self.oracle.compare_batch(rest, [pivot] * len(rest))
+
+        for item, item_wins in zip(rest, results):
+            if item_wins:
                 # item > pivot
                 greater.append(item)
                 winner = item
@@ -1,11 +1,57 @@
 """Bradley-Terry ranking tracker for JSI algorithm."""
 
 import numpy as np
-import choix
 import warnings
+from scipy.optimize import minimize
+from scipy.special import expit
 from typing import List, Dict, Tuple, Optional
 
 
+def fit_bt_strengths(
+    n_items: int,
+    comparisons: List[Tuple[int, int]],
+    penalty: float = 0.01,
+    initial: Optional[np.ndarray] = None
+) -> np.ndarray:
+    """Fit Bradley-Terry strengths by penalized maximum likelihood.
+
+    The log-likelihood and its gradient are evaluated over the whole edge
+    list at once. The small L2 penalty keeps strengths finite when some item
+    never loses (or never wins), which is always the case for the
+    comparisons a quicksort makes.
+
+    Args:
+        n_items: Number of items
+        comparisons: (winner_idx, loser_idx) pairs
+        penalty: L2 regularization strength
+        initial: Starting strengths, e.g. the previous fit on a subset of
+            the comparisons (defaults to all zeros)
+
+    Returns:
+        Zero-mean strength (log-scale) for each item
+    """
+    edges = np.asarray(comparisons, dtype=np.intp).reshape(-1, 2)
+    winners, losers = edges[:, 0], edges[:, 1]
+
+    def objective(params):
+        diff = params[winners] - params[losers]
+        value = penalty * params.dot(params) + np.logaddexp(0.0, -diff).sum()
+        # d/d(diff) of log(1 + exp(-diff)) is -expit(-diff)
+        z = expit(-diff)
+        grad = (
+            2 * penalty * params
+            - np.bincount(winners, weights=z, minlength=n_items)
+            + np.bincount(losers, weights=z, minlength=n_items)
+        )
+        return value, grad
+
+    x0 = np.zeros(n_items) if initial is None else np.asarray(initial, dtype=float)
+    result = minimize(objective, x0, jac=True, method='L-BFGS-B')
+    if not np.all(np.isfinite(result.x)):
+        raise RuntimeError("Bradley-Terry fit did not converge")
+    return result.x - result.x.mean()
+
+
 class SimpleRankingTracker:
     """Simple ranking tracker for JSI without complex uncertainty estimation."""
 
@@ -18,6 +64,9 @@ class SimpleRankingTracker:
         self.items = items
         self.comparisons = []  # (winner_idx, loser_idx)
         self.name_to_idx = {name: i for i, name in enumerate(items)}
+        # Last Bradley-Terry fit and how many comparisons it covered
+        self._strengths = None
+        self._fitted_count = 0
 
     def add_comparison(self, item_a: str, item_b: str, winner: str) -> None:
         """Add a comparison result.
@@ -40,23 +89,17 @@ class SimpleRankingTracker:
         if not self.comparisons:
             return self.items.copy()
 
-        win_counts = [0] * len(self.items)
-        total_counts = [0] * len(self.items)
-
-        for winner_idx, loser_idx in self.comparisons:
-            win_counts[winner_idx] += 1
-            total_counts[winner_idx] += 1
-            total_counts[loser_idx] += 1
-
-        # Calculate win rates
-        win_rates = []
-        for i in range(len(self.items)):
-            if total_counts[i] > 0:
-                win_rates.append((win_counts[i] / total_counts[i], self.items[i]))
-            else:
-                win_rates.append((0.5, self.items[i]))
-
-        win_rates.sort(reverse=True)
+        n_items = len(self.items)
+        edges = np.asarray(self.comparisons, dtype=np.intp)
+        win_counts = np.bincount(edges[:, 0], minlength=n_items)
+        total_counts = win_counts + np.bincount(edges[:, 1], minlength=n_items)
+
+        # Calculate win rates (0.5 for items never compared)
+        rates = np.divide(
+            win_counts, total_counts,
+            out=np.full(n_items, 0.5), where=total_counts > 0
+        )
+        win_rates = sorted(zip(rates.tolist(), self.items), reverse=True)
         return [item for _, item in win_rates]
 
     def get_bt_ranking_with_confidence(self) -> Tuple[List[str], float, Dict[str, float]]:
@@ -69,9 +112,16 @@ class SimpleRankingTracker:
             return self.get_simple_ranking(), 0.0, {}
 
         try:
-            with warnings.catch_warnings():
-                warnings.simplefilter("ignore", RuntimeWarning)
-                strengths = choix.ilsr_pairwise(len(self.items), self.comparisons)
+            # Comparisons are only ever appended, so an unchanged count means
+            # the last fit is still current; otherwise it is a warm start
+            if self._strengths is None or self._fitted_count != len(self.comparisons):
+                with warnings.catch_warnings():
+                    warnings.simplefilter("ignore", RuntimeWarning)
+                    self._strengths = fit_bt_strengths(
+                        len(self.items), self.comparisons, initial=self._strengths
+                    )
+                self._fitted_count = len(self.comparisons)
+            strengths = self._strengths
 
             # Calculate real confidence based on model convergence
             # Higher comparison density = higher confidence
@@ -2,76 +2,275 @@
 Audio analysis tools for frequency domain comparisons using librosa.
 """
 
+import hashlib
+import math
+import os
 import librosa
 import numpy as np
+from collections import OrderedDict
+from numba import njit
 from pathlib import Path
+from scipy.fft import rfft
+from scipy.signal import get_window
 from typing import Tuple, Optional
 import soundfile as sf
 
 
+# Decoded audio keyed by (resolved path, mtime, size, sample rate); the
+# fitness loop reloads the same target file for every evaluation
+_AUDIO_CACHE_SIZE = 16
+_audio_cache = OrderedDict()
+
+
+@njit(cache=True, fastmath=True)
+def _spectral_convergence_kernel(mag1, mag2):
+    """Spectral convergence over the frames both spectrograms have, in one pass.
+
+    Args:
+        mag1: (bins, frames) reference magnitude spectrogram
+        mag2: (bins, frames) magnitude spectrogram to compare
+
+    Returns:
+        sqrt(sum((mag1 - mag2)**2) / sum(mag1**2)), or 0.0 if mag1 is silent
+    """
+    # Frames are the outer loop because the STFT magnitude is column-major
+    n_frames = min(mag1.shape[1], mag2.shape[1])
+    num = 0.0
+    den = 0.0
+    for t in range(n_frames):
+        for f in range(mag1.shape[0]):
+            x = mag1[f, t]
+            d = x - mag2[f, t]
+            num += d * d
+            den += x * x
+    if den == 0.0:
+        return 0.0
+    return math.sqrt(num / den)
+
+
+@njit(cache=True, fastmath=True)
+def _frequency_distance_kernel(
+    scalar1, scalar2, mfcc1, mfcc2, chroma1, chroma2, mag1, mag2, weights
+):
+    """Weighted sum of all six feature distances, without intermediate arrays.
+
+    Args:
+        scalar1, scalar2: (3, frames) centroid, bandwidth and rolloff rows
+        mfcc1, mfcc2: (n_mfcc, frames) MFCCs
+        chroma1, chroma2: (12, frames) chroma
+        mag1, mag2: (bins, frames) magnitude spectrograms; only the frames
+            both have are compared
+        weights: centroid, bandwidth, rolloff, mfcc, chroma and magnitude
+            weights, in that order
+
+    Returns:
+        Weighted frequency-domain distance
+    """
+    n_frames = scalar1.shape[1]
+    frame_sum = 0.0
+    for t in range(n_frames):
+        mfcc_sq = 0.0
+        for c in range(mfcc1.shape[0]):
+            d = mfcc1[c, t] - mfcc2[c, t]
+            mfcc_sq += d * d
+        chroma_sq = 0.0
+        for c in range(chroma1.shape[0]):
+            d = chroma1[c, t] - chroma2[c, t]
+            chroma_sq += d * d
+        frame_sum += (
+            weights[0] * abs(scalar1[0, t] - scalar2[0, t])
+            + weights[1] * abs(scalar1[1, t] - scalar2[1, t])
+            + weights[2] * abs(scalar1[2, t] - scalar2[2, t])
+            + weights[3] * math.sqrt(mfcc_sq)
+            + weights[4] * math.sqrt(chroma_sq)
+        )
+    return frame_sum / n_frames + weights[5] * _spectral_convergence_kernel(mag1, mag2)
+
+
 class FrequencyDistanceCalculator:
     """Calculate frequency-domain distance between audio files"""
 
-    def __init__(self, sr: int = 44100, n_fft: int = 2048, hop_length: int = 512):
-        """Initialize with audio processing parameters"""
+    def __init__(
+        self,
+        sr: int = 44100,
+        n_fft: int = 2048,
+        hop_length: int = 512,
+        feature_cache_size: int = 8,
+        fft_workers: int = -1
+    ):
+        """Initialize with audio processing parameters
+
+        fft_workers is passed to scipy's rfft; -1 uses every core, while
+        calculators running in a process pool use 1 to avoid oversubscription.
+        """
         self.sr = sr
         self.n_fft = n_fft
         self.hop_length = hop_length
+        self.fft_workers = fft_workers
+
+        # Periodic Hann window, as librosa.stft uses, built once
+        self._window = get_window('hann', n_fft, fftbins=True).astype(np.float32)
+
+        # Bin frequencies and mel filter bank depend only on the parameters,
+        # so they are not rebuilt for every signal
+        self._fft_freqs = librosa.fft_frequencies(sr=sr, n_fft=n_fft)
+        self._mel_basis = librosa.filters.mel(sr=sr, n_fft=n_fft)
+
+        # Features of recently analyzed signals, keyed by content digest. The
+        # target is compared against every candidate, so it is analyzed once.
+        self.feature_cache_size = feature_cache_size
+        self._feature_cache = OrderedDict()
 
     def load_audio(self, file_path: Path) -> np.ndarray:
         """Load audio file and return time-domain signal"""
         if not file_path.exists():
             raise FileNotFoundError(f"Audio file not found: {file_path}")
 
+        stat = file_path.stat()
+        key = (str(file_path.resolve()), stat.st_mtime_ns, stat.st_size, self.sr)
+        y = _audio_cache.get(key)
+        if y is not None:
+            _audio_cache.move_to_end(key)
+            return y
+
+        y = self._load_decoded(file_path, stat)
+        _audio_cache[key] = y
+        if len(_audio_cache) > _AUDIO_CACHE_SIZE:
+            _audio_cache.popitem(last=False)
+        return y
+
+    def _load_decoded(self, file_path: Path, stat: os.stat_result) -> np.ndarray:
+        """Decode and resample once, keeping a float32 .npy next to the source
+
+        Later loads memory-map the .npy, skipping decode and resampling. The
+        returned array is read-only; copy before modifying.
+        """
+        cache_path = file_path.with_suffix(f'.{self.sr}.f32.npy')
+        try:
+            if cache_path.stat().st_mtime_ns >= stat.st_mtime_ns:
+                return np.load(cache_path, mmap_mode='r')
+        except (OSError, ValueError):
+            pass
+
         # Load audio with librosa
-        y, sr = librosa.load(str(file_path), sr=self.sr, mono=True)
+        y, sr = librosa.load(str(file_path), sr=self.sr, mono=True, dtype=np.float32)
+
+        # Write through a temporary file so a concurrent reader never maps a
+        # partial array; an unwritable directory just means no disk cache
+        tmp_path = cache_path.with_name(f'{cache_path.name}.{os.getpid()}.tmp')
+        try:
+            with open(tmp_path, 'wb') as f:
+                np.save(f, y)
+            os.replace(tmp_path, cache_path)
+        except OSError:
+            tmp_path.unlink(missing_ok=True)
+
+        y.setflags(write=False)
         return y
 
+    def _stft(self, audio: np.ndarray) -> np.ndarray:
+        """Centered STFT matching librosa.stft, with the window precomputed"""
+        padded = np.pad(audio, self.n_fft // 2, mode='constant')
+        frames = np.lib.stride_tricks.sliding_window_view(padded, self.n_fft)[::self.hop_length]
+        # The windowed frames are a fresh array, so pocketfft may transform
+        # them in place, threaded across fft_workers cores
+        return rfft(
+            frames * self._window, axis=-1, workers=self.fft_workers, overwrite_x=True
+        ).T
+
     def compute_spectral_features(self, audio: np.ndarray) -> dict:
         """Compute spectral features from audio signal"""
+        # Single precision throughout halves the memory traffic of every
+        # feature; a complex64 STFT gives a float32 magnitude
+        audio = np.asarray(audio, dtype=np.float32)
+
         # Compute STFT
-        stft = librosa.stft(audio, n_fft=self.n_fft, hop_length=self.hop_length)
+        stft = self._stft(audio)
         magnitude = np.abs(stft)
 
-        # Compute spectral features
-        spectral_centroid = librosa.feature.spectral_centroid(
-            S=magnitude, sr=self.sr, hop_length=self.hop_length
-        )[0]
-
-        spectral_bandwidth = librosa.feature.spectral_bandwidth(
-            S=magnitude, sr=self.sr, hop_length=self.hop_length
-        )[0]
-
-        spectral_rolloff = librosa.feature.spectral_rolloff(
-            S=magnitude, sr=self.sr, hop_length=self.hop_length
-        )[0]
+        # Compute per-frame scalar features as rows of one (3, frames) array
+        scalar_features = self._scalar_features(magnitude)
 
-        # Compute MFCCs
-        mfccs = librosa.feature.mfcc(
-            y=audio, sr=self.sr, n_mfcc=13, hop_length=self.hop_length
-        )
+        # Compute MFCCs from the same STFT instead of letting librosa redo it
+        mel = self._mel_basis @ (magnitude ** 2)
+        mfccs = librosa.feature.mfcc(S=librosa.power_to_db(mel), n_mfcc=13)
 
-        # Compute chroma features
+        # Compute chroma features; librosa estimates the tuning of each
+        # signal first, so its filter bank cannot be precomputed
         chroma = librosa.feature.chroma_stft(
             S=magnitude, sr=self.sr, hop_length=self.hop_length
         )
 
         return {
-            'spectral_centroid': spectral_centroid,
-            'spectral_bandwidth': spectral_bandwidth,
-            'spectral_rolloff': spectral_rolloff,
+            'spectral_centroid': scalar_features[0],
+            'spectral_bandwidth': scalar_features[1],
+            'spectral_rolloff': scalar_features[2],
+            'scalar_features': scalar_features,
             'mfccs': mfccs,
             'chroma': chroma,
             'magnitude_spectrum': magnitude
         }
 
+    def _scalar_features(self, magnitude: np.ndarray) -> np.ndarray:
+        """Spectral centroid, bandwidth and rolloff (85%) of each frame
+
+        Same definitions as librosa.feature, computed from one magnitude
+        spectrogram with the precomputed bin frequencies.
+
+        Returns:
+            (3, frames) float32 array with one feature per row
+        """
+        freqs = self._fft_freqs
+
+        # Each frame as a distribution over frequency; silent frames stay zero
+        norms = magnitude.sum(axis=0)
+        norms[norms < np.finfo(magnitude.dtype).tiny] = 1.0
+        weights = magnitude / norms
+
+        centroid = freqs @ weights
+        bandwidth = np.sqrt(np.sum(weights * (freqs[:, None] - centroid) ** 2, axis=0))
+
+        # Lowest frequency below which 85% of the frame's magnitude lies
+        cumulative = np.cumsum(magnitude, axis=0)
+        rolloff = freqs[np.argmax(cumulative >= 0.85 * cumulative[-1], axis=0)]
+
+        return np.vstack([centroid, bandwidth, rolloff], dtype=np.float32)
+
+    def _cached_spectral_features(self, audio: np.ndarray) -> dict:
+        """Return spectral features, reusing them for a signal seen recently"""
+        audio = np.ascontiguousarray(audio, dtype=np.float32)
+        key = (audio.shape, audio.dtype.str, hashlib.blake2b(audio, digest_size=16).digest())
+
+        features = self._feature_cache.get(key)
+        if features is not None:
+            self._feature_cache.move_to_end(key)
+            return features
+
+        features = self.compute_spectral_features(audio)
+        self._feature_cache[key] = features
+        if len(self._feature_cache) > self.feature_cache_size:
+            self._feature_cache.popitem(last=False)
+        return features
+
+    def clear_cache(self) -> None:
+        """Drop all cached spectral features"""
+        self._feature_cache.clear()
+
     def compute_frequency_distance(
         self,
         audio1: np.ndarray,
         audio2: np.ndarray,
         weights: Optional[dict] = None
     ) -> float:
-        """Compute frequency-domain distance between two audio signals"""
+        """Compute frequency-domain distance between two audio signals
+
+        The longer signal is truncated to the shorter one first, so every
+        feature of both signals spans the same frames.
+        """
+        n_samples = min(len(audio1), len(audio2))
+        audio1 = audio1[:n_samples]
+        audio2 = audio2[:n_samples]
+
         if weights is None:
             weights = {
                 'spectral_centroid': 1.0,
@@ -82,64 +281,30 @@ class FrequencyDistanceCalculator:
                 'magnitude': 0.3
             }
 
-        features1 = self.compute_spectral_features(audio1)
-        features2 = self.compute_spectral_features(audio2)
-
-        total_distance = 0.0
-
-        # Spectral centroid distance
-        centroid_dist = np.mean(np.abs(
-            features1['spectral_centroid'] - features2['spectral_centroid']
-        ))
-        total_distance += weights['spectral_centroid'] * centroid_dist
-
-        # Spectral bandwidth distance
-        bandwidth_dist = np.mean(np.abs(
-            features1['spectral_bandwidth'] - features2['spectral_bandwidth']
+        features1 = self._cached_spectral_features(audio1)
+        features2 = self._cached_spectral_features(audio2)
+
+        weight_vector = np.array([
+            weights['spectral_centroid'],
+            weights['spectral_bandwidth'],
+            weights['spectral_rolloff'],
+            weights['mfcc'],
+            weights['chroma'],
+            weights['magnitude']
+        ], dtype=np.float64)
+
+        return float(_frequency_distance_kernel(
+            features1['scalar_features'], features2['scalar_features'],
+            features1['mfccs'], features2['mfccs'],
+            features1['chroma'], features2['chroma'],
+            features1['magnitude_spectrum'], features2['magnitude_spectrum'],
+            weight_vector
         ))
-        total_distance += weights['spectral_bandwidth'] * bandwidth_dist
-
-        # Spectral rolloff distance
-        rolloff_dist = np.mean(np.abs(
-            features1['spectral_rolloff'] - features2['spectral_rolloff']
-        ))
-        total_distance += weights['spectral_rolloff'] * rolloff_dist
-
-        # MFCC distance
-        mfcc_dist = np.mean(np.sqrt(np.sum(
-            (features1['mfccs'] - features2['mfccs']) ** 2, axis=0
-        )))
-        total_distance += weights['mfcc'] * mfcc_dist
-
-        # Chroma distance
-        chroma_dist = np.mean(np.sqrt(np.sum(
-            (features1['chroma'] - features2['chroma']) ** 2, axis=0
-        )))
-        total_distance += weights['chroma'] * chroma_dist
-
-        # Magnitude spectrum distance (using spectral convergence)
-        mag_dist = self._spectral_convergence(
-            features1['magnitude_spectrum'],
-            features2['magnitude_spectrum']
-        )
-        total_distance += weights['magnitude'] * mag_dist
-
-        return total_distance
 
     def _spectral_convergence(self, X: np.ndarray, Y: np.ndarray) -> float:
         """Compute spectral convergence between two magnitude spectrograms"""
-        # Ensure same shape by taking minimum dimensions
-        min_frames = min(X.shape[1], Y.shape[1])
-        X = X[:, :min_frames]
-        Y = Y[:, :min_frames]
-
-        numerator = np.sum((X - Y) ** 2)
-        denominator = np.sum(X ** 2)
-
-        if denominator == 0:
-            return 0.0
-
-        return np.sqrt(numerator / denominator)
+        # Only the frames both spectrograms have are compared
+        return float(_spectral_convergence_kernel(X, Y))
 
     def calculate_distance_from_files(
         self,
@@ -160,38 +325,57 @@ class FrequencyDistanceCalculator:
             y=audio, sr=self.sr, hop_length=self.hop_length
         )
 
-        # Extract fundamental frequency
-        f0_values = []
-        for t in range(pitches.shape[1]):
-            index = magnitudes[:, t].argmax()
-            pitch = pitches[index, t]
-            if pitch > 0:
-                f0_values.append(pitch)
+        # Extract fundamental frequency: the pitch of the strongest bin per frame
+        strongest = magnitudes.argmax(axis=0)
+        f0_values = pitches[strongest, np.arange(pitches.shape[1])]
+        f0_values = f0_values[f0_values > 0]
 
-        if not f0_values:
+        if f0_values.size == 0:
             return 0.0, 0.0
 
-        f0_mean = np.mean(f0_values)
-        f0_std = np.std(f0_values)
+        return float(f0_values.mean()), float(f0_values.std())
+
 
-        return f0_mean, f0_std
+# Generated targets keyed by (resolved path, mtime, shift); pitch shifting
+# runs a full phase-vocoder round trip, so repeated requests reuse the result
+_TARGET_CACHE_SIZE = 32
+_target_cache = OrderedDict()
 
 
 def create_target_audio_generator(
     base_audio_path: Path,
     target_frequency_shift: float = 0.0
 ) -> np.ndarray:
-    """Generate target audio with specified frequency characteristics"""
+    """Generate target audio with specified frequency characteristics
+
+    Results are cached and returned read-only; copy before modifying.
+    """
     calculator = FrequencyDistanceCalculator()
-    base_audio = calculator.load_audio(base_audio_path)
+    if not base_audio_path.exists():
+        raise FileNotFoundError(f"Audio file not found: {base_audio_path}")
+
+    key = (
+        str(base_audio_path.resolve()),
+        base_audio_path.stat().st_mtime_ns,
+        round(float(target_frequency_shift), 6)
+    )
+    target = _target_cache.get(key)
+    if target is not None:
+        _target_cache.move_to_end(key)
+        return target
+
+    target = calculator.load_audio(base_audio_path)
 
     # Simple pitch shifting using librosa
     if target_frequency_shift != 0.0:
         # Convert frequency shift to semitones (approximate)
         semitones = 12 * np.log2(1 + target_frequency_shift / 440.0)
-        shifted_audio = librosa.effects.pitch_shift(
-            base_audio, sr=calculator.sr, n_steps=semitones
+        target = librosa.effects.pitch_shift(
+            target, sr=calculator.sr, n_steps=semitones
         )
-        return shifted_audio
 
-    return base_audio
+    target.setflags(write=False)
+    _target_cache[key] = target
+    if len(_target_cache) > _TARGET_CACHE_SIZE:
+        _target_cache.popitem(last=False)
+    return target
@@ -3,6 +3,8 @@ REAPER integration for genetic algorithm optimization.
 Handles session execution, audio rendering, and result collection.
 """
 
+import hashlib
+import re
 import subprocess
 import time
 import shutil
@@ -11,11 +13,88 @@ from typing import List, Dict, Optional, Tuple
 import json
 import os
 import signal
+from concurrent.futures import ProcessPoolExecutor
 from .config import SessionConfig, RenderConfig
 from .genetics import Solution
 from .audio_analysis import FrequencyDistanceCalculator
 
 
+# Render IDs embed the individual as f"{session_name}_individual_{i:03d}"
+_INDIVIDUAL_ID_PATTERN = re.compile(r'individual_(\d+)')
+
+# Worker pool shared by every evaluator and kept across generations, so
+# processes are spawned once per run rather than once per population
+_POOL = None
+
+# Per-worker calculators keyed by (sr, n_fft, hop_length); each keeps the
+# target's features cached between tasks. The pool already has one process
+# per core, so their FFTs run single-threaded
+_worker_calculators = {}
+
+
+def _get_pool() -> ProcessPoolExecutor:
+    """Return the shared analysis pool, starting it on first use"""
+    global _POOL
+    if _POOL is None:
+        _POOL = ProcessPoolExecutor(max_workers=os.cpu_count())
+    return _POOL
+
+
+def _worker_calculator(sr: int, n_fft: int, hop_length: int) -> FrequencyDistanceCalculator:
+    """This worker's calculator for the given analysis parameters"""
+    calculator = _worker_calculators.get((sr, n_fft, hop_length))
+    if calculator is None:
+        calculator = FrequencyDistanceCalculator(
+            sr=sr, n_fft=n_fft, hop_length=hop_length, fft_workers=1
+        )
+        _worker_calculators[(sr, n_fft, hop_length)] = calculator
+    return calculator
+
+
+def _render_digest(args: Tuple[Path, int, int, int]) -> Optional[str]:
+    """Worker task: decode one render and return the digest of its samples
+
+    Decoding leaves a .npy next to the render, so later loads (by workers or
+    the parent) memory-map it instead of decoding again. Returns None if the
+    render cannot be loaded.
+    """
+    rendered_path, sr, n_fft, hop_length = args
+    try:
+        return _audio_digest(_worker_calculator(sr, n_fft, hop_length).load_audio(rendered_path))
+    except Exception:
+        return None
+
+
+def _distance_to_target(args: Tuple[Path, Path, int, int, int]) -> Optional[float]:
+    """Worker task: frequency distance from one render to the target
+
+    Audio is loaded by path, so a worker maps the decoded .npy written when
+    the render was digested instead of receiving samples. Returns None on failure so
+    the parent can evaluate (and report) that render itself.
+    """
+    target_path, rendered_path, sr, n_fft, hop_length = args
+    try:
+        calculator = _worker_calculator(sr, n_fft, hop_length)
+        return calculator.compute_frequency_distance(
+            calculator.load_audio(target_path), calculator.load_audio(rendered_path)
+        )
+    except Exception:
+        return None
+
+
+def _audio_digest(audio) -> str:
+    """Digest of decoded samples, identifying identical renders"""
+    return hashlib.blake2b(audio, digest_size=16).hexdigest()
+
+
+# File under FitnessEvaluator's cache_dir holding distances between runs
+_DISTANCE_CACHE_FILE = "audio_distance_cache.json"
+
+# Stored in that file; bump it whenever compute_frequency_distance or its
+# default weights change, so distances saved by an older version are dropped
+_DISTANCE_CACHE_VERSION = 1
+
+
 class ReaperExecutor:
     """Execute REAPER sessions and collect rendered audio"""
 
@@ -136,20 +215,82 @@ class FitnessEvaluator:
     def __init__(
         self,
         target_audio_path: Optional[Path] = None,
-        distance_calculator: Optional[FrequencyDistanceCalculator] = None
+        distance_calculator: Optional[FrequencyDistanceCalculator] = None,
+        parallel: bool = True,
+        cache_dir: Optional[Path] = None
     ):
-        """Initialize fitness evaluator with target audio and distance calculator"""
+        """Initialize fitness evaluator with target audio and distance calculator
+
+        With parallel set and more than one CPU, evaluate_population analyzes
+        renders in a shared process pool. With cache_dir set, distances are
+        loaded from and saved to a JSON file there, so restarted runs skip
+        renders they have already analyzed.
+        """
         self.target_audio_path = target_audio_path
         self.distance_calculator = distance_calculator or FrequencyDistanceCalculator()
+        self.parallel = parallel
+        self.cache_dir = cache_dir
         self._target_audio = None
+        # Distances per target (and analysis parameters), each keyed by a
+        # digest of the rendered samples, so an identical render is never
+        # analyzed twice; _distance_cache is the current target's entry
+        self._distances_by_target = self._load_distance_cache()
+        self._distance_cache = {}
+        self._distance_cache_dirty = False
 
         if target_audio_path and target_audio_path.exists():
             self._target_audio = self.distance_calculator.load_audio(target_audio_path)
+            self._distance_cache = self._distances_for_target()
 
     def set_target_audio(self, target_audio_path: Path) -> None:
         """Set the target audio for fitness evaluation"""
         self.target_audio_path = target_audio_path
         self._target_audio = self.distance_calculator.load_audio(target_audio_path)
+        self._distance_cache = self._distances_for_target()
+
+    def _distances_for_target(self) -> Dict[str, float]:
+        """Distance memo for the current target audio
+
+        The calculator's class is part of the key, so a subclass with its own
+        distance or weights never shares distances with the default one.
+        """
+        calculator = self.distance_calculator
+        calculator_type = type(calculator)
+        key = (
+            f"{_audio_digest(self._target_audio)}"
+            f"-{calculator_type.__module__}.{calculator_type.__qualname__}"
+            f"-{calculator.sr}-{calculator.n_fft}-{calculator.hop_length}"
+        )
+        return self._distances_by_target.setdefault(key, {})
+
+    def _load_distance_cache(self) -> Dict[str, Dict[str, float]]:
+        """Read saved distances, starting empty if they are missing, unreadable or from another version"""
+        if self.cache_dir is None:
+            return {}
+        try:
+            with open(self.cache_dir / _DISTANCE_CACHE_FILE) as f:
+                data = json.load(f)
+        except (OSError, ValueError):
+            return {}
+        if not isinstance(data, dict) or data.get('version') != _DISTANCE_CACHE_VERSION:
+            return {}
+        distances = data.get('distances')
+        return distances if isinstance(distances, dict) else {}
+
+    def save_distance_cache(self) -> None:
+        """Write distances to cache_dir if any were added since the last save"""
+        if self.cache_dir is None or not self._distance_cache_dirty:
+            return
+
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        cache_path = self.cache_dir / _DISTANCE_CACHE_FILE
+        tmp_path = cache_path.with_name(f"{cache_path.name}.{os.getpid()}.tmp")
+        with open(tmp_path, 'w') as f:
+            json.dump(
+                {'version': _DISTANCE_CACHE_VERSION, 'distances': self._distances_by_target}, f
+            )
+        os.replace(tmp_path, cache_path)
+        self._distance_cache_dirty = False
 
     def evaluate_solution(self, solution: Solution, rendered_audio_path: Path) -> float:
         """Evaluate fitness of a single solution based on rendered audio"""
@@ -165,10 +306,15 @@ class FitnessEvaluator:
             # Load rendered audio
             rendered_audio = self.distance_calculator.load_audio(rendered_audio_path)
 
-            # Calculate frequency domain distance
-            distance = self.distance_calculator.compute_frequency_distance(
-                self._target_audio, rendered_audio
-            )
+            key = _audio_digest(rendered_audio)
+            distance = self._distance_cache.get(key)
+            if distance is None:
+                # Calculate frequency domain distance
+                distance = self.distance_calculator.compute_frequency_distance(
+                    self._target_audio, rendered_audio
+                )
+                self._distance_cache[key] = distance
+                self._distance_cache_dirty = True
 
             return distance
 
@@ -177,6 +323,49 @@ class FitnessEvaluator:
             # Return high penalty for evaluation errors
             return 500.0
 
+    def _prefetch_distances(self, rendered_audio_paths: List[Path]) -> None:
+        """Fill the distance memo for new renders using the process pool
+
+        Workers decode and digest every render, then analyze the ones whose
+        digest is not yet known. Workers build plain calculators from the
+        analysis parameters, so a custom calculator is always run here in
+        the parent instead. Renders the workers cannot analyze are left out,
+        so evaluate_solution handles (and reports) them as usual.
+        """
+        calculator = self.distance_calculator
+        if (
+            not self.parallel
+            or (os.cpu_count() or 1) < 2
+            or self._target_audio is None
+            or type(calculator) is not FrequencyDistanceCalculator
+            or len(rendered_audio_paths) < 2
+        ):
+            return
+
+        params = (calculator.sr, calculator.n_fft, calculator.hop_length)
+        chunksize = max(1, len(rendered_audio_paths) // (4 * os.cpu_count()))
+        digests = _get_pool().map(
+            _render_digest,
+            [(path, *params) for path in rendered_audio_paths],
+            chunksize=chunksize
+        )
+
+        pending = {}
+        for path, key in zip(rendered_audio_paths, digests):
+            if key is not None and key not in self._distance_cache:
+                pending.setdefault(key, path)
+
+        if len(pending) < 2:
+            return
+
+        tasks = [(self.target_audio_path, path, *params) for path in pending.values()]
+        chunksize = max(1, len(tasks) // (4 * os.cpu_count()))
+        distances = _get_pool().map(_distance_to_target, tasks, chunksize=chunksize)
+        for key, distance in zip(pending, distances):
+            if distance is not None:
+                self._distance_cache[key] = distance
+                self._distance_cache_dirty = True
+
     def _parameter_based_fitness(self, solution: Solution) -> float:
         """Fallback fitness based on parameter values when no target audio is available"""
         # Simple fitness function: prefer values closer to center
@@ -192,15 +381,23 @@ class FitnessEvaluator:
         """Evaluate fitness for entire population"""
         fitness_values = []
 
+        # Index renders by individual once instead of scanning every render
+        # for every solution; the first render naming an individual wins
+        renders_by_index = {}
+        for path_id, path in render_paths.items():
+            match = _INDIVIDUAL_ID_PATTERN.search(path_id)
+            if match:
+                renders_by_index.setdefault(int(match.group(1)), path)
+
+        self._prefetch_distances([
+            renders_by_index[i] for i in range(len(solutions)) if i in renders_by_index
+        ])
+
         for i, solution in enumerate(solutions):
             individual_id = f"individual_{i:03d}"
 
             # Find matching rendered audio file
-            matching_path = None
-            for path_id, path in render_paths.items():
-                if individual_id in path_id:
-                    matching_path = path
-                    break
+            matching_path = renders_by_index.get(i)
 
             if matching_path is None:
                 # No matching render found
@@ -223,13 +420,17 @@ class ReaperGAIntegration:
         self,
         reaper_project_path: Path,
         target_audio_path: Optional[Path] = None,
-        session_name_prefix: str = "ga_optimization"
+        session_name_prefix: str = "ga_optimization",
+        cache_dir: Optional[Path] = None
     ):
-        """Initialize GA-REAPER integration"""
+        """Initialize GA-REAPER integration
+
+        cache_dir, if given, persists fitness distances between runs.
+        """
         self.reaper_project_path = reaper_project_path
         self.session_name_prefix = session_name_prefix
         self.executor = ReaperExecutor(reaper_project_path)
-        self.evaluator = FitnessEvaluator(target_audio_path)
+        self.evaluator = FitnessEvaluator(target_audio_path, cache_dir=cache_dir)
         self.generation_counter = 0
 
     def evaluate_population_fitness(self, solutions: List[Solution]) -> List[float]:
@@ -258,6 +459,7 @@ class ReaperGAIntegration:
 
             # Evaluate fitness
             fitness_values = self.evaluator.evaluate_population(solutions, render_paths)
+            self.evaluator.save_distance_cache()
 
             # Log generation statistics
             self._log_generation_stats(self.generation_counter, solutions, fitness_values)